@@ -1,6 +1,12 @@
 """Application entry point (Unicode-safe, PyInstaller-ready, with app icon)"""
+import multiprocessing
 import os
 import sys
+from utils.import_report import ImportReport
+
+# Started before the heavy imports below so the timeline covers them
+IMPORT_REPORT = ImportReport()
+
 from PyQt5.QtWidgets import QApplication
 from PyQt5.QtGui import QIcon
 from ui.main_window import SecurePassPro
@@ -70,8 +76,15 @@ def main():
     window = SecurePassPro()
     window.show()
 
+    # OpenCV/pyzbar should not be loaded yet; they are prewarmed from here
+    window.logger.info(IMPORT_REPORT.mark("Main window shown"))
+    window.prewarm_qr_backends(IMPORT_REPORT)
+
     sys.exit(app.exec_())
 
 
 if __name__ == "__main__":
+    # Bulk QR import/export workers re-run this script under spawn (Windows,
+    # macOS, PyInstaller builds); freeze_support runs the worker instead
+    multiprocessing.freeze_support()
     main()
@@ -95,6 +95,9 @@ LICENSE_ICON_PATH = resource_path(":/assets/icons/license_icon.png")
 SAVE_ICON_PATH = resource_path(":/assets/icons/save_icon.ico")
 TERMS_ICON_PATH = resource_path(":/assets/icons/terms_icon.png")
 
+# Binary Qt resource bundle (tools/build_resources.py); falls back to resources_rc.py
+RESOURCE_BUNDLE_NAME = os.getenv("RESOURCE_BUNDLE_NAME", "resources.rcc")
+
 # Wordlist
 #_default_wordlist = os.path.join("assets", "wordlist", "eff_file.wordlist")
 WORDLIST_PATH = resource_path(os.getenv("WORDLIST_PATH", ":/assets/wordlist/eff_file.wordlist"))
@@ -131,14 +134,39 @@ QR_ERROR_CORRECTION = "H"
 QR_BOX_SIZE = 10
 QR_BORDER = 4
 QR_LOGO_RATIO = 0.25
+QR_LOGO_CACHE_SIZE = 8  # scaled logos kept in memory (LRU)
+QR_MATRIX_CACHE_SIZE = 32  # encoded QR matrices kept in memory only (LRU, zeroized)
+QR_PREWARM_BACKENDS = True  # import OpenCV/pyzbar in the background after startup
+QR_PREWARM_DELAY_MS = 500
+QR_UPDATE_DEBOUNCE_MS = 120  # quiet time after a keystroke before re-rendering
+QR_LATENCY_LOG_EVERY = 25  # live QR renders between logged keystroke-to-QR latency summaries
+QR_BATCH_CHUNK_SIZE = 64  # credentials encoded per worker task in batch export
+QR_SHEET_COLUMNS = 4
+QR_SHEET_ROWS = 5
+QR_SHEET_CELL_SIZE = 400  # px per code on printed sheets
+QR_SHEET_DPI = 300
+QR_VECTOR_LOGO_SIZE = None  # px of the logo embedded in SVG/PDF; None = its printed size (QR_LOGO_RATIO of the code)
 
 # Password Generation
 SYMBOLS = "!@#$%^&*()_+-=[]{}|;:,.<>?"
-MAX_GENERATION_ATTEMPTS = 100000
+
+# Bulk Generation
+RANDOM_POOL_SIZE = 64 * 1024  # bytes pre-fetched from os.urandom per refill
+BULK_BATCH_SIZE = 4096  # credentials produced per pool draw
+
+# Credential Export
+EXPORT_BUFFER_SIZE = 1024 * 1024  # bytes buffered before each write
+EXPORT_FSYNC_EVERY = 0  # records between fsyncs (0 = only at the end)
 
 # Camera Settings
 MAX_CAMERA_ATTEMPTS = 5
 CAMERA_BACKEND = "DSHOW"  # Windows specific; use "" for cross-platform
+QR_SCAN_DECODE_WIDTH = 640  # frames are downscaled to this width before decoding
+QR_SCAN_PREVIEW_WIDTH = 480
+QR_DECODE_RACE = False  # run all QR decoders concurrently per image instead of in turn
+QR_DECODE_MAX_SIDE = 1024  # px; larger images are decoded downscaled first
+QR_DECODE_MIN_SIDE = 400  # px; smaller images also get a 2x upscaled attempt
+QR_IMPORT_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".gif", ".tif", ".tiff", ".webp")
 
 # ---------------------------------------------------------
 # 🌐 External Links
@@ -0,0 +1,71 @@
+# benchmarks/passphrase_benchmark.py
+"""Random case passphrase throughput: per-character coin flips vs bit masks
+
+Compares the bit-mask engine (core.random_case, one random byte per 8
+characters) against the previous per-character secrets.randbelow(2),
+for single passphrases (generate) and in bulk (generate_many).
+
+Usage:
+    python benchmarks/passphrase_benchmark.py [--iterations N] [--count N]
+"""
+import argparse
+import os
+import secrets
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.passphrase_generator import PassphraseGenerator  # noqa: E402
+from core.wordlist_registry import WordlistRegistry  # noqa: E402
+
+WORD_COUNTS = (4, 6, 8, 12)
+
+
+class PerCharRandomCaseGenerator(PassphraseGenerator):
+    """Random case with one CSPRNG call per character (previous behaviour)"""
+
+    def _apply_case(self, words, case_mode, read=secrets.token_bytes):
+        if case_mode.lower() == "random case":
+            return ["".join(c.upper() if secrets.randbelow(2) else c.lower() for c in word) for word in words]
+        return super()._apply_case(words, case_mode, read)
+
+
+def time_single(generator, num_words, iterations):
+    """Mean microseconds per generate call"""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        generator.generate(num_words, "-", "random case")
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def time_bulk(generator, num_words, count):
+    """Mean microseconds per passphrase from generate_many"""
+    start = time.perf_counter()
+    for _ in generator.generate_many(count, num_words, "-", "random case"):
+        pass
+    return (time.perf_counter() - start) / count * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=5000, help="single passphrases per size")
+    parser.add_argument("--count", type=int, default=100000, help="bulk passphrases per size")
+    args = parser.parse_args()
+
+    wordlist = WordlistRegistry.get()
+    before = PerCharRandomCaseGenerator(wordlist)
+    after = PassphraseGenerator(wordlist)
+
+    for label, timer, amount in (("generate", time_single, args.iterations),
+                                 ("generate_many", time_bulk, args.count)):
+        print(f"\n{label} (random case, {amount:,} passphrases)")
+        print(f"{'words':>5}  {'per-char (us)':>13}  {'bit-mask (us)':>13}  {'speedup':>7}")
+        for num_words in WORD_COUNTS:
+            old = timer(before, num_words, amount)
+            new = timer(after, num_words, amount)
+            print(f"{num_words:>5}  {old:>13.1f}  {new:>13.1f}  {old / new:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# benchmarks/password_benchmark.py
+"""Per-password latency of generate_advanced across lengths
+
+Compares the direct arrangement (swap-remove picks, quotas laid out with
+no neighbouring groups) against the previous generate_advanced, which
+rebuilt the list of unused characters before every pick and then
+reshuffled the whole password until no two neighbours shared a group.
+
+The default SYMBOLS (26 characters) cap unique-character passwords at 88,
+so both generators use all 32 ASCII punctuation characters here; that is
+94 distinct printable characters and every length in LENGTHS is reachable.
+
+Usage:
+    python benchmarks/password_benchmark.py [--iterations N] [--legacy-iterations N]
+"""
+import argparse
+import os
+import random
+import secrets
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.password_generator import PasswordGenerator  # noqa: E402
+
+LENGTHS = (8, 16, 24, 32, 40, 48, 64, 80, 88, 94)
+LEGACY_SHUFFLE_ATTEMPTS = 100000  # previous MAX_GENERATION_ATTEMPTS
+
+
+class LegacyAdvancedGenerator(PasswordGenerator):
+    """The previous generate_advanced: O(n) picks, then shuffle-and-retry"""
+
+    def generate_advanced(self, length, use_upper=True, use_lower=True, use_numbers=True, use_symbols=True):
+        groups = self._build_groups(use_upper, use_lower, use_numbers, use_symbols)
+        if not groups:
+            raise ValueError("At least one character type must be selected")
+
+        if length > len(set(c for _, chars in groups for c in chars)):
+            raise ValueError("Password length too long to ensure unique characters")
+
+        password_chars = []
+        used_chars = set()
+        last_group = None
+
+        for name, chars in groups:
+            ch = self._pick_char(chars, used_chars)
+            if ch:
+                password_chars.append((name, ch))
+                used_chars.add(ch)
+                last_group = name
+
+        while len(password_chars) < length:
+            candidates = [g for g in groups if g[0] != last_group] or groups
+            name, chars = secrets.choice(candidates)
+            ch = self._pick_char(chars, used_chars)
+            if not ch:
+                break
+            password_chars.append((name, ch))
+            used_chars.add(ch)
+            last_group = name
+
+        for _ in range(LEGACY_SHUFFLE_ATTEMPTS):
+            random.shuffle(password_chars)
+            if all(password_chars[i][0] != password_chars[i + 1][0]
+                   for i in range(len(password_chars) - 1)):
+                return "".join(ch for _, ch in password_chars)
+
+        random.shuffle(password_chars)
+        return "".join(ch for _, ch in password_chars)
+
+    @staticmethod
+    def _pick_char(chars, used_chars):
+        available = [c for c in chars if c not in used_chars]
+        return secrets.choice(available) if available else None
+
+
+def time_per_password(generator, length, iterations):
+    """Return mean microseconds per generate_advanced call"""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        generator.generate_advanced(length)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000, help="passwords per length (current)")
+    parser.add_argument("--legacy-iterations", type=int, default=20,
+                        help="passwords per length (previous; long lengths exhaust the shuffle retries)")
+    args = parser.parse_args()
+
+    before = LegacyAdvancedGenerator(symbols=string.punctuation)
+    after = PasswordGenerator(symbols=string.punctuation)
+
+    print(f"{'length':>6}  {'previous (us)':>13}  {'current (us)':>12}  {'speedup':>9}")
+    for length in LENGTHS:
+        old = time_per_password(before, length, args.legacy_iterations)
+        new = time_per_password(after, length, args.iterations)
+        print(f"{length:>6}  {old:>13.1f}  {new:>12.1f}  {old / new:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
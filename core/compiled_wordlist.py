@@ -0,0 +1,215 @@
+# core/compiled_wordlist.py
+"""Compiled wordlists: memory-mapped offset table + packed UTF-8 words"""
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+from collections.abc import Sequence
+
+COMPILED_WORDLIST_MAGIC = b"CTWL"
+COMPILED_WORDLIST_VERSION = 1
+COMPILED_WORDLIST_EXT = ".cwl"
+
+# magic, version, flags (reserved), word count, blob size,
+# SHA-256 of offset table + blob, CRC-32 of the preceding header bytes
+_HEADER = struct.Struct("<4sHHIQ32sI")
+
+
+def parse_wordlist_lines(lines):
+    """Yield the words of text wordlist lines
+
+    Accepts plain one-word-per-line files and EFF/Diceware lists
+    ("12345<TAB>word"). Blank lines are skipped.
+    """
+    for line in lines:
+        parts = line.split()
+        if parts:
+            yield parts[-1] if len(parts) == 2 else parts[0]
+
+
+def read_wordlist_words(path):
+    """Yield the words of a text wordlist file (see parse_wordlist_lines)"""
+    with open(path, "r", encoding="utf-8") as f:
+        yield from parse_wordlist_lines(f)
+
+
+def is_compiled_wordlist(path):
+    """True if path is a file starting with the compiled wordlist magic"""
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(COMPILED_WORDLIST_MAGIC)) == COMPILED_WORDLIST_MAGIC
+    except OSError:
+        return False
+
+
+def compile_wordlist(source, output, dedupe=True):
+    """Convert a text wordlist into the compiled format
+
+    Layout (little-endian):
+
+        header      56 bytes, see _HEADER
+        offsets     (count + 1) uint32, word i is blob[offsets[i]:offsets[i + 1]]
+        blob        the UTF-8 words, back to back
+
+    The file is written next to output and renamed into place, so a
+    running application never maps a half-written file.
+
+    Args:
+        source: Text wordlist path
+        output: Compiled wordlist path
+        dedupe: Drop repeated words (keeps the first), so every entry
+            carries the same log2(count) bits of entropy
+
+    Returns:
+        Number of words written
+    """
+    seen = set()
+    encoded = []
+    for word in read_wordlist_words(source):
+        if dedupe:
+            if word in seen:
+                continue
+            seen.add(word)
+        encoded.append(word.encode("utf-8"))
+
+    offsets = array("I", [0])
+    total = 0
+    for data in encoded:
+        total += len(data)
+        if total > 0xFFFFFFFF:
+            raise ValueError(f"{source} is too large for a compiled wordlist (4 GiB of words)")
+        offsets.append(total)
+    if sys.byteorder == "big":
+        offsets.byteswap()
+
+    table = offsets.tobytes()
+    blob = b"".join(encoded)
+    digest = hashlib.sha256(table)
+    digest.update(blob)
+
+    header = _HEADER.pack(COMPILED_WORDLIST_MAGIC, COMPILED_WORDLIST_VERSION, 0,
+                          len(encoded), len(blob), digest.digest(), 0)[:-4]
+    header += struct.pack("<I", zlib.crc32(header))
+
+    tmp_path = f"{output}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        f.write(table)
+        f.write(blob)
+    os.replace(tmp_path, output)
+    return len(encoded)
+
+
+class CompiledWordlist(Sequence):
+    """Read-only, memory-mapped view of a compiled wordlist
+
+    Opening only validates the fixed-size header; words are decoded one
+    at a time when indexed, so startup cost and resident memory do not
+    grow with the list. It behaves like a list of str for len(),
+    indexing, slicing, iteration and secrets.choice().
+    """
+
+    def __init__(self, path, verify=False):
+        """Map a compiled wordlist
+
+        Args:
+            path: Compiled wordlist file
+            verify: Also check the SHA-256 of the whole table and blob
+                (reads every page of the file)
+
+        Raises:
+            ValueError: If the file is not a valid compiled wordlist
+        """
+        self.path = path
+        self._table = None
+        self._offsets = None
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < _HEADER.size:
+                raise ValueError(f"{path} is not a compiled wordlist")
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            self._open(size, verify)
+        except Exception:
+            self.close()
+            raise
+
+    def _open(self, size, verify):
+        magic, version, _, count, blob_size, digest, crc = _HEADER.unpack_from(self._mm, 0)
+        if magic != COMPILED_WORDLIST_MAGIC:
+            raise ValueError(f"{self.path} is not a compiled wordlist")
+        if version != COMPILED_WORDLIST_VERSION:
+            raise ValueError(f"{self.path}: unsupported compiled wordlist version {version}")
+        if zlib.crc32(self._mm[:_HEADER.size - 4]) != crc:
+            raise ValueError(f"{self.path}: header checksum mismatch")
+
+        table_size = (count + 1) * 4
+        if size != _HEADER.size + table_size + blob_size:
+            raise ValueError(f"{self.path}: truncated or padded compiled wordlist")
+
+        self._count = count
+        self._blob_start = _HEADER.size + table_size
+        self._digest = digest
+
+        table = memoryview(self._mm)[_HEADER.size:self._blob_start]
+        if sys.byteorder == "little" and array("I").itemsize == 4:
+            # Zero-copy: index the mapped table directly
+            self._table = table
+            self._offsets = table.cast("I")
+        else:
+            offsets = array("I" if array("I").itemsize == 4 else "L")
+            offsets.frombytes(table)
+            table.release()
+            if sys.byteorder == "big":
+                offsets.byteswap()
+            self._offsets = offsets
+
+        if verify and hashlib.sha256(self._mm[_HEADER.size:]).digest() != digest:
+            raise ValueError(f"{self.path}: content checksum mismatch")
+
+    @property
+    def digest(self):
+        """Hex SHA-256 of the word data, as stored in the header"""
+        return self._digest.hex()
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._word(i) for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("wordlist index out of range")
+        return self._word(index)
+
+    def __iter__(self):
+        for i in range(self._count):
+            yield self._word(i)
+
+    def _word(self, index):
+        start = self._blob_start
+        return self._mm[start + self._offsets[index]:start + self._offsets[index + 1]].decode("utf-8")
+
+    def close(self):
+        """Unmap the file (words already read stay valid)"""
+        for view in (self._offsets, self._table):
+            if isinstance(view, memoryview):
+                view.release()
+        self._offsets = self._table = None
+        if not self._mm.closed:
+            self._mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __repr__(self):
+        return f"CompiledWordlist({self.path!r}, {self._count} words)"
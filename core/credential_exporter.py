@@ -0,0 +1,155 @@
+# core/credential_exporter.py
+"""Streaming export of generated credentials to CSV, JSON Lines and KeePass XML"""
+import base64
+import csv
+import json
+import os
+import uuid
+from xml.sax.saxutils import escape
+
+from app_config.app_config import APP_NAME, EXPORT_BUFFER_SIZE, EXPORT_FSYNC_EVERY
+
+
+def open_private(path, mode="w", **kwargs):
+    """open() a file for writing, readable by the owner only
+
+    The 0o600 creation mode only applies to new files, so an existing file
+    is tightened with fchmod as well (POSIX). Keyword arguments go to
+    os.fdopen (encoding, newline, buffering).
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        if hasattr(os, "fchmod"):
+            os.fchmod(fd, 0o600)
+        return os.fdopen(fd, mode, **kwargs)
+    except BaseException:
+        os.close(fd)
+        raise
+
+
+class CredentialExporter:
+    """Writes credentials to disk one record at a time (constant memory)
+
+    Any iterable of strings works as input, e.g. PasswordGenerator.generate_many
+    or a generator expression over PassphraseGenerator.generate.
+    """
+
+    FORMATS = ("csv", "jsonl", "keepass")
+    EXTENSIONS = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl", ".xml": "keepass"}
+
+    def __init__(self, buffer_size=None, fsync_every=None):
+        """Initialize exporter
+
+        Args:
+            buffer_size: Write buffer size in bytes (default: EXPORT_BUFFER_SIZE)
+            fsync_every: Flush and fsync after this many records, 0 to only
+                sync once at the end (default: EXPORT_FSYNC_EVERY)
+        """
+        self.buffer_size = buffer_size or EXPORT_BUFFER_SIZE
+        self.fsync_every = EXPORT_FSYNC_EVERY if fsync_every is None else fsync_every
+
+    def export(self, credentials, path, fmt=None, kind="password", title_prefix="Credential", group_name=None):
+        """Stream credentials into a file
+
+        Records go to "<path>.tmp", which replaces path only after the final
+        fsync; if anything fails mid-stream (generator error, full disk,
+        Ctrl-C) the temporary file is removed and path is left as it was.
+
+        Args:
+            credentials: Iterable of credential strings
+            path: Output file path
+            fmt: "csv", "jsonl" or "keepass" (default: from file extension)
+            kind: Record label written to each row ("password" or "passphrase")
+            title_prefix: Entry titles are "<prefix> <n>"
+            group_name: KeePass group name (default: APP_NAME)
+
+        Returns:
+            Number of records written
+
+        Raises:
+            ValueError: If the format is unknown
+        """
+        fmt = fmt or self.detect_format(path)
+        if fmt not in self.FORMATS:
+            raise ValueError(f"Unsupported export format: {fmt}")
+
+        writer = getattr(self, f"_write_{fmt}")
+        tmp_path = f"{path}.tmp"
+        try:
+            with self._open(tmp_path) as f:
+                count = writer(f, credentials, kind, title_prefix, group_name or APP_NAME)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        return count
+
+    @classmethod
+    def detect_format(cls, path):
+        """Guess export format from file extension"""
+        ext = os.path.splitext(path)[1].lower()
+        if ext not in cls.EXTENSIONS:
+            raise ValueError(f"Cannot infer export format from extension: {ext or path}")
+        return cls.EXTENSIONS[ext]
+
+    def _open(self, path):
+        """Open output file for writing, readable by the owner only"""
+        return open_private(path, "w", encoding="utf-8", newline="", buffering=self.buffer_size)
+
+    def _records(self, f, credentials):
+        """Enumerate credentials, syncing to disk every fsync_every records"""
+        for index, secret in enumerate(credentials, 1):
+            yield index, secret
+            if self.fsync_every and index % self.fsync_every == 0:
+                f.flush()
+                os.fsync(f.fileno())
+
+    def _write_csv(self, f, credentials, kind, title_prefix, group_name):
+        writer = csv.writer(f)
+        writer.writerow(["title", "type", "secret"])
+        count = 0
+        for count, secret in self._records(f, credentials):
+            writer.writerow([f"{title_prefix} {count}", kind, secret])
+        return count
+
+    def _write_jsonl(self, f, credentials, kind, title_prefix, group_name):
+        count = 0
+        for count, secret in self._records(f, credentials):
+            f.write(json.dumps({"title": f"{title_prefix} {count}", "type": kind, "secret": secret},
+                               ensure_ascii=False))
+            f.write("\n")
+        return count
+
+    def _write_keepass(self, f, credentials, kind, title_prefix, group_name):
+        """KeePass 2.x XML, importable via File > Import > KeePass XML (2.x)"""
+        f.write('<?xml version="1.0" encoding="utf-8" standalone="yes"?>\n')
+        f.write("<KeePassFile>\n")
+        f.write(f"\t<Meta>\n\t\t<Generator>{escape(APP_NAME)}</Generator>\n\t</Meta>\n")
+        f.write("\t<Root>\n\t\t<Group>\n")
+        f.write(f"\t\t\t<UUID>{self._keepass_uuid()}</UUID>\n")
+        f.write(f"\t\t\t<Name>{escape(group_name)}</Name>\n")
+
+        count = 0
+        for count, secret in self._records(f, credentials):
+            f.write(
+                "\t\t\t<Entry>\n"
+                f"\t\t\t\t<UUID>{self._keepass_uuid()}</UUID>\n"
+                f"\t\t\t\t<String><Key>Title</Key><Value>{escape(f'{title_prefix} {count}')}</Value></String>\n"
+                f"\t\t\t\t<String><Key>Notes</Key><Value>{escape(kind)}</Value></String>\n"
+                "\t\t\t\t<String><Key>Password</Key>"
+                f"<Value ProtectInMemory=\"True\">{escape(secret)}</Value></String>\n"
+                "\t\t\t</Entry>\n"
+            )
+
+        f.write("\t\t</Group>\n\t</Root>\n</KeePassFile>\n")
+        return count
+
+    @staticmethod
+    def _keepass_uuid():
+        """KeePass stores UUIDs as base64 of the 16 raw bytes"""
+        return base64.b64encode(uuid.uuid4().bytes).decode("ascii")
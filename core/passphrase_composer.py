@@ -0,0 +1,287 @@
+# core/passphrase_composer.py
+"""Passphrases composed from several wordlists, with exact entropy per template"""
+import math
+import secrets
+from bisect import bisect_right
+from collections import namedtuple
+
+from app_config.app_config import BULK_BATCH_SIZE
+from core.passphrase_generator import apply_case
+from core.random_pool import RandomBytePool
+from core.wordlist_registry import WordlistRegistry
+
+# One word position: choices is a tuple of (list name, integer weight)
+TemplateSlot = namedtuple("TemplateSlot", "choices")
+
+# shannon: average bits; min_entropy: bits against an attacker who tries the
+# most likely passphrases first (the figure to compare with a target);
+# slots: per-slot (shannon, min_entropy)
+TemplateEntropy = namedtuple("TemplateEntropy", "shannon min_entropy slots")
+
+
+def parse_template(text):
+    """Parse a template string into slots
+
+    Slots are separated by spaces. A slot is a list name ("long"), or
+    weighted alternatives separated by "|" with optional integer weights
+    ("short:3|de:1", weight 1 when omitted).
+
+    Example:
+        "long short:3|de:1 long" -> a long-list word, then a word from
+        "short" (75%) or "de" (25%), then another long-list word
+    """
+    slots = []
+    for part in text.split():
+        choices = []
+        for option in part.split("|"):
+            name, _, weight = option.partition(":")
+            try:
+                choices.append((name, int(weight) if weight else 1))
+            except ValueError:
+                raise ValueError(f"Invalid weight in template slot '{part}'") from None
+        slots.append(TemplateSlot(tuple(choices)))
+    return slots
+
+
+class PassphraseComposer:
+    """Generates passphrases from templates over several named wordlists
+
+    Each template slot draws its word from one list (positional) or first
+    picks a list by integer weight, then a word uniformly from it. Lists
+    given as paths come from WordlistRegistry, so every composer and
+    PassphraseGenerator shares the same tuples / memory-mapped compiled
+    lists.
+
+    Entropy is computed exactly from each slot's word distribution: words
+    are compared case-insensitively (the case modes cannot tell "Apple"
+    from "apple"), and words present in several lists of a slot, or
+    repeated within one list, count as one outcome with their combined
+    probability. Random case adds about one bit per letter on top, which
+    is not counted. Slot distributions are computed once per composer.
+    """
+
+    def __init__(self, wordlists):
+        """Initialize with named wordlists
+
+        Args:
+            wordlists: dict name -> path (text or compiled, resolved by
+                WordlistRegistry; None for the default list) or a sequence
+                of words
+
+        Raises:
+            ValueError: If a wordlist is empty
+            OSError: If a wordlist file cannot be read
+        """
+        self.wordlists = {}
+        for name, source in wordlists.items():
+            if source is None or isinstance(source, str):
+                words = WordlistRegistry.get(source, fallback=False)
+            else:
+                words = source
+            if not words:
+                raise ValueError(f"Wordlist '{name}' is empty")
+            self.wordlists[name] = words
+
+        self._slot_entropy = {}
+        self._mean_length = {}
+        self._random_pool = None
+
+    def compile(self, template):
+        """Validate a template
+
+        Args:
+            template: Template string (see parse_template), or a sequence
+                whose items are list names, {name: weight} dicts or
+                TemplateSlots
+
+        Returns:
+            Tuple of TemplateSlot
+
+        Raises:
+            ValueError: If the template is empty, names an unknown list, or
+                has a weight that is not a positive integer
+        """
+        if isinstance(template, str):
+            template = parse_template(template)
+
+        slots = []
+        for item in template:
+            if isinstance(item, TemplateSlot):
+                slot = item
+            elif isinstance(item, str):
+                slot = TemplateSlot(((item, 1),))
+            else:
+                slot = TemplateSlot(tuple(item.items()))
+
+            for name, weight in slot.choices:
+                if name not in self.wordlists:
+                    raise ValueError(f"Unknown wordlist '{name}' in template")
+                if not isinstance(weight, int) or weight <= 0:
+                    raise ValueError(f"Weight of '{name}' must be a positive integer")
+            slots.append(slot)
+
+        if not slots:
+            raise ValueError("Template has no words")
+        return tuple(slots)
+
+    def entropy(self, template):
+        """Exact entropy of the word sequence a template produces
+
+        Returns:
+            TemplateEntropy(shannon, min_entropy, slots) in bits
+        """
+        slots = [self._entropy_of(slot) for slot in self.compile(template)]
+        return TemplateEntropy(sum(s for s, _ in slots), sum(m for _, m in slots), tuple(slots))
+
+    def plan(self, target_bits, names=None):
+        """Shortest positional template reaching target_bits of min-entropy
+
+        Uses as few words as possible (all from the list with the most bits
+        per word), then moves slots to lists with shorter words while the
+        total stays at or above the target.
+
+        Args:
+            target_bits: Required min-entropy in bits
+            names: Lists to use (default: all)
+
+        Returns:
+            List of list names, usable as a template
+        """
+        names = list(names or self.wordlists)
+        bits = {name: self._entropy_of(TemplateSlot(((name, 1),)))[1] for name in names}
+        best = max(names, key=bits.get)
+        if bits[best] <= 0:
+            raise ValueError("Wordlists need at least two distinct words")
+
+        template = [best] * max(1, math.ceil(target_bits / bits[best] - 1e-9))
+        total = bits[best] * len(template)
+        shorter_first = sorted(names, key=self._mean_word_length)
+
+        for i, current in enumerate(template):
+            for name in shorter_first:
+                if self._mean_word_length(name) >= self._mean_word_length(current):
+                    break
+                if total - bits[current] + bits[name] >= target_bits - 1e-9:
+                    total += bits[name] - bits[current]
+                    template[i] = name
+                    break
+        return template
+
+    def generate(self, template, separator="-", word_case="lowercase"):
+        """Generate one passphrase from a template
+
+        Args:
+            template: See compile()
+            separator: String to join words (default: "-")
+            word_case: Case transformation ("lowercase", "uppercase", "title case", "random case")
+
+        Returns:
+            Generated passphrase string
+        """
+        words = [self._pick(slot) for slot in self.compile(template)]
+        words = apply_case(words, word_case)
+        return separator.join(words) if separator else "".join(words)
+
+    def generate_many(self, count, template, separator="-", word_case="lowercase", batch_size=None):
+        """Generate many passphrases from one template with a batched byte pool
+
+        List choices and word indices for a whole batch are drawn per slot
+        with RandomBytePool.randbelow_many (unbiased rejection sampling).
+
+        Args:
+            count: Number of passphrases
+            template: See compile()
+            separator: String to join words (default: "-")
+            word_case: Case transformation
+            batch_size: Passphrases produced per pool draw (default: BULK_BATCH_SIZE)
+
+        Yields:
+            Generated passphrase strings
+        """
+        slots = self.compile(template)
+        pool = self._get_random_pool()
+        batch_size = batch_size or BULK_BATCH_SIZE
+        separator = separator or ""
+        num_words = len(slots)
+
+        remaining = count
+        while remaining > 0:
+            batch = min(batch_size, remaining)
+            columns = [self._draw_column(slot, batch, pool) for slot in slots]
+            words = apply_case([word for row in zip(*columns) for word in row], word_case, pool.read)
+
+            for start in range(0, batch * num_words, num_words):
+                yield separator.join(words[start:start + num_words])
+            remaining -= batch
+
+    # ---------------------------------------------------------
+    # Internals
+    # ---------------------------------------------------------
+    def _pick(self, slot):
+        choices = slot.choices
+        name = choices[0][0]
+        if len(choices) > 1:
+            r = secrets.randbelow(sum(weight for _, weight in choices))
+            for name, weight in choices:
+                if r < weight:
+                    break
+                r -= weight
+        words = self.wordlists[name]
+        return words[secrets.randbelow(len(words))]
+
+    def _draw_column(self, slot, batch, pool):
+        """Words for one slot across a batch of passphrases"""
+        choices = slot.choices
+        if len(choices) == 1:
+            words = self.wordlists[choices[0][0]]
+            return list(map(words.__getitem__, pool.randbelow_many(len(words), batch)))
+
+        bounds = []
+        total = 0
+        for _, weight in choices:
+            total += weight
+            bounds.append(total)
+        picks = [bisect_right(bounds, r) for r in pool.randbelow_many(total, batch)]
+
+        column = [None] * batch
+        for j, (name, _) in enumerate(choices):
+            rows = [row for row, pick in enumerate(picks) if pick == j]
+            words = self.wordlists[name]
+            for row, index in zip(rows, pool.randbelow_many(len(words), len(rows))):
+                column[row] = words[index]
+        return column
+
+    def _entropy_of(self, slot):
+        """(shannon, min_entropy) bits of one slot's case-folded word distribution"""
+        cached = self._slot_entropy.get(slot)
+        if cached is not None:
+            return cached
+
+        total = sum(weight for _, weight in slot.choices)
+        probabilities = {}
+        for name, weight in slot.choices:
+            words = self.wordlists[name]
+            p = weight / (total * len(words))
+            for word in words:
+                key = word.lower()
+                probabilities[key] = probabilities.get(key, 0.0) + p
+
+        shannon = -sum(p * math.log2(p) for p in probabilities.values())
+        min_entropy = -math.log2(max(probabilities.values()))
+        shannon = max(0.0, shannon)
+        # Min-entropy never exceeds Shannon entropy; clamp float rounding
+        result = self._slot_entropy[slot] = (shannon, max(0.0, min(min_entropy, shannon)))
+        return result
+
+    def _mean_word_length(self, name):
+        length = self._mean_length.get(name)
+        if length is None:
+            words = self.wordlists[name]
+            length = self._mean_length[name] = sum(map(len, words)) / len(words)
+        return length
+
+    def _get_random_pool(self):
+        """Create the byte pool on first bulk request"""
+        if self._random_pool is None:
+            self._random_pool = RandomBytePool()
+        return self._random_pool
@@ -1,68 +1,60 @@
 # core/passphrase_generator.py
 """Passphrase generation from wordlist"""
 import secrets
-import os
-from PyQt5.QtCore import QFile, QIODevice, QTextStream
-from app_config.app_config import *
+
+from app_config.app_config import BULK_BATCH_SIZE
+from core.random_case import random_case
+from core.random_pool import RandomBytePool
+from core.wordlist_registry import WordlistRegistry
+
+
+# Per-word transforms by case mode; "random case" uses core.random_case
+_CASE_TRANSFORMS = {"lowercase": str.lower, "uppercase": str.upper, "title case": str.title}
+
+
+def apply_case(words, case_mode, read=secrets.token_bytes):
+    """Apply a case mode ("lowercase", "uppercase", "title case", "random case") to words
+
+    read supplies the random bytes for "random case" (one byte per
+    8 characters): secrets.token_bytes, or a pool's read in bulk.
+    Unknown modes fall back to lowercase.
+    """
+    mode = case_mode.lower() if case_mode else "lowercase"
+    if mode == "random case":
+        return random_case(words, read)
+    return list(map(_CASE_TRANSFORMS.get(mode, str.lower), words))
+
 
 class WordlistManager:
-    """Manages wordlist loading from files and Qt resources"""
+    """Manages wordlist loading from files and Qt resources
+
+    Loading goes through WordlistRegistry, so each wordlist is parsed once
+    per process and shared (read-only) by every generator.
+    """
 
     @staticmethod
     def load_from_file(path):
-        """Load wordlist from file path"""
-        if not path or not os.path.exists(path):
-            return []
-
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                words = [line.strip() for line in f if line.strip()]
-            return words
-        except Exception:
-            return []
+        """Load wordlist from a text or compiled (memory-mapped) file path"""
+        return WordlistManager._get(path, fallback=False)
 
     @staticmethod
     def load_from_resource(resource_path):
         """Load wordlist from Qt resource (:/path/to/file)"""
-        qfile = QFile(resource_path)
-        if not qfile.open(QIODevice.ReadOnly | QIODevice.Text):
-            return []
-
-        try:
-            stream = QTextStream(qfile)
-            content = stream.readAll()
-            words = [line.strip() for line in content.split('\n') if line.strip()]
-            return words
-        except Exception:
-            return []
-        finally:
-            qfile.close()
+        return WordlistManager._get(resource_path, fallback=False)
 
     @staticmethod
     def load(path):
-        """Load wordlist from file or Qt resource"""
-        # If path starts with :/, it's a Qt resource
-        if path and path.startswith(":/"):
-            return WordlistManager.load_from_resource(path)
-
-        # Otherwise try regular file path
-        words = WordlistManager.load_from_file(path)
-        if words:
-            return words
-
-        # Fallback: try common local paths
-        fallback_paths = [
-            "assets/wordlist/eff_file.wordlist",
-            "wordlist/eff_file.wordlist",
-            "./eff_file.wordlist",
-        ]
+        """Load wordlist from file or Qt resource, falling back to the bundled EFF list"""
+        return WordlistManager._get(path, fallback=True)
 
-        for fallback_path in fallback_paths:
-            words = WordlistManager.load_from_file(fallback_path)
-            if words:
-                return words
-
-        return []
+    @staticmethod
+    def _get(path, fallback):
+        if not path and not fallback:
+            return []
+        try:
+            return WordlistRegistry.get(path, fallback=fallback)
+        except (OSError, ValueError):
+            return []
 
 
 class PassphraseGenerator:
@@ -72,12 +64,13 @@ class PassphraseGenerator:
         """Initialize with wordlist
 
         Args:
-            wordlist: List of words. If None, uses fallback empty list.
+            wordlist: List of words (or CompiledWordlist). If None, uses fallback empty list.
         """
         if wordlist is None:
             wordlist = []
 
         self.wordlist = wordlist if wordlist else []
+        self._random_pool = None
 
     def generate(self, num_words, separator="-", word_case="lowercase"):
         """Generate passphrase with specified parameters
@@ -101,24 +94,64 @@ class PassphraseGenerator:
 
         return separator.join(words) if separator else "".join(words)
 
-    def _apply_case(self, words, case_mode):
-        """Apply case transformation to words"""
-        result = []
-        for word in words:
-            case_lower = case_mode.lower() if case_mode else "lowercase"
-
-            if case_lower == "uppercase":
-                result.append(word.upper())
-            elif case_lower == "title case":
-                result.append(word.title())
-            elif case_lower == "random case":
-                result.append("".join(
-                    c.upper() if secrets.randbelow(2) else c.lower() for c in word
-                ))
-            else:  # Lowercase (default)
-                result.append(word.lower())
-
-        return result
+    def generate_many(self, count, num_words, separator="-", word_case="lowercase", batch_size=None):
+        """Generate many passphrases from a batched CSPRNG byte pool
+
+        Same word distribution as generate, but the word indices of a whole
+        batch are drawn at once from pre-fetched random bytes with unbiased
+        rejection sampling, and case transforms are applied per batch.
+
+        Args:
+            count: Number of passphrases
+            num_words: Number of words in each passphrase
+            separator: String to join words (default: "-")
+            word_case: Case transformation ("lowercase", "uppercase", "title case", "random case")
+            batch_size: Passphrases produced per pool draw (default: BULK_BATCH_SIZE)
+
+        Returns:
+            Iterator of generated passphrase strings
+
+        Raises:
+            ValueError: If wordlist is empty (raised by this call, before
+                any passphrase is drawn)
+        """
+        if not self.wordlist:
+            raise ValueError("Wordlist is empty. Cannot generate passphrase.")
+
+        return self._generate_many(count, num_words, separator, word_case, batch_size)
+
+    def _generate_many(self, count, num_words, separator, word_case, batch_size):
+        """Passphrase stream behind generate_many (wordlist already validated)"""
+        if num_words <= 0:
+            # Like generate, zero words give empty passphrases
+            for _ in range(count):
+                yield ""
+            return
+
+        pool = self._get_random_pool()
+        batch_size = batch_size or BULK_BATCH_SIZE
+        separator = separator or ""
+        pick = self.wordlist.__getitem__
+
+        remaining = count
+        while remaining > 0:
+            batch = min(batch_size, remaining)
+            indices = pool.randbelow_many(len(self.wordlist), batch * num_words)
+            words = self._apply_case(list(map(pick, indices)), word_case, pool.read)
+
+            for start in range(0, batch * num_words, num_words):
+                yield separator.join(words[start:start + num_words])
+            remaining -= batch
+
+    def _apply_case(self, words, case_mode, read=secrets.token_bytes):
+        """Apply case transformation to words (see apply_case)"""
+        return apply_case(words, case_mode, read)
+
+    def _get_random_pool(self):
+        """Create the byte pool on first bulk request"""
+        if self._random_pool is None:
+            self._random_pool = RandomBytePool()
+        return self._random_pool
 
     def is_ready(self):
         """Check if generator has a valid wordlist"""
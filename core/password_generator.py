@@ -2,8 +2,8 @@
 """Password generation logic - cryptographically secure"""
 import string
 import secrets
-import random
-from app_config.app_config import SYMBOLS, MAX_GENERATION_ATTEMPTS, LOGO_PATH
+from app_config.app_config import SYMBOLS, LOGO_PATH, BULK_BATCH_SIZE
+from core.random_pool import RandomBytePool
 
 
 class PasswordGenerator:
@@ -12,6 +12,7 @@ class PasswordGenerator:
     def __init__(self, symbols=None, logo_path=None):
         self.symbols = symbols or SYMBOLS
         self.logo_path = logo_path or LOGO_PATH
+        self._random_pool = None
 
     def generate_basic(self, length, use_upper=True, use_lower=True, use_numbers=True, use_symbols=True):
         """Generate password using basic method (fast)
@@ -35,9 +36,67 @@ class PasswordGenerator:
 
         return "".join(secrets.choice(charset) for _ in range(length))
 
+    def generate_many(self, count, length, use_upper=True, use_lower=True, use_numbers=True,
+                      use_symbols=True, batch_size=None):
+        """Generate many passwords from a batched CSPRNG byte pool
+
+        Same character distribution as generate_basic, but random bytes are
+        pre-fetched in bulk and mapped to the charset with rejection sampling.
+
+        Args:
+            count: Number of passwords
+            length: Password length
+            use_upper: Include uppercase letters
+            use_lower: Include lowercase letters
+            use_numbers: Include numbers
+            use_symbols: Include special symbols
+            batch_size: Passwords produced per pool draw (default: BULK_BATCH_SIZE)
+
+        Returns:
+            Iterator of generated password strings
+
+        Raises:
+            ValueError: If no character type selected (raised by this call,
+                before any password is drawn)
+        """
+        charset = self._build_charset(use_upper, use_lower, use_numbers, use_symbols)
+        if not charset:
+            raise ValueError("At least one character type must be selected")
+
+        return self._generate_many(count, length, charset, batch_size)
+
+    def _generate_many(self, count, length, charset, batch_size):
+        """Password stream behind generate_many (charset already validated)"""
+        if length <= 0:
+            # Like generate_basic, a non-positive length gives empty passwords
+            for _ in range(count):
+                yield ""
+            return
+
+        pool = self._get_random_pool()
+        batch_size = batch_size or BULK_BATCH_SIZE
+        fast_path = len(charset) <= 256 and charset.isascii()
+
+        remaining = count
+        while remaining > 0:
+            batch = min(batch_size, remaining)
+            if fast_path:
+                stream = pool.translate_stream(charset, batch * length)
+            else:
+                stream = "".join(charset[i] for i in pool.randbelow_many(len(charset), batch * length))
+
+            for start in range(0, batch * length, length):
+                yield stream[start:start + length]
+            remaining -= batch
+
     def generate_advanced(self, length, use_upper=True, use_lower=True, use_numbers=True, use_symbols=True):
         """Generate password with no consecutive types and no repetitions
 
+        The arrangement is built directly: group quotas are drawn first, then
+        the group sequence is laid out so no two neighbours share a group.
+        Characters come from per-group pools with O(1) swap-remove picks, so
+        cost is linear in length and the result is always valid.
+
         Args:
             length: Password length
             use_upper: Include uppercase letters
@@ -55,33 +114,35 @@ class PasswordGenerator:
         if not groups:
             raise ValueError("At least one character type must be selected")
 
-        if length > self._count_unique_chars(groups):
+        pools = self._build_pools(groups)
+
+        if length > sum(len(pool) for pool in pools):
             raise ValueError("Password length too long to ensure unique characters")
 
-        password_chars = []
-        used_chars = set()
-        last_group = None
-
-        # Ensure at least one char from each group
-        for name, chars in groups:
-            ch = self._pick_char(chars, used_chars)
-            if ch:
-                password_chars.append((name, ch))
-                used_chars.add(ch)
-                last_group = name
-
-        # Fill remaining positions
-        while len(password_chars) < length:
-            candidates = [g for g in groups if g[0] != last_group] or groups
-            name, chars = secrets.choice(candidates)
-            ch = self._pick_char(chars, used_chars)
-            if not ch:
-                break  # fallback if no unique chars left
-            password_chars.append((name, ch))
-            used_chars.add(ch)
-            last_group = name
-
-        return self._shuffle_no_consecutive(password_chars)
+        if length > self._max_alternating_length(pools):
+            raise ValueError("Password length too long to alternate character types")
+
+        while len(pools) > length:
+            # Not enough positions for every group: use a random subset
+            pools.pop(secrets.randbelow(len(pools)))
+
+        quotas = self._draw_group_quotas(pools, length)
+        sequence = self._arrange_groups(quotas, length)
+
+        return "".join(self._take_random(pools[index]) for index in sequence)
+
+    def max_advanced_length(self, use_upper=True, use_lower=True, use_numbers=True, use_symbols=True):
+        """Longest password generate_advanced can build for these options"""
+        pools = self._build_pools(self._build_groups(use_upper, use_lower, use_numbers, use_symbols))
+        if not pools:
+            return 0
+        return min(sum(len(pool) for pool in pools), self._max_alternating_length(pools))
+
+    def _get_random_pool(self):
+        """Create the shared byte pool on first bulk request"""
+        if self._random_pool is None:
+            self._random_pool = RandomBytePool()
+        return self._random_pool
 
     def _build_charset(self, use_upper, use_lower, use_numbers, use_symbols):
         """Build character set from options"""
@@ -109,14 +170,34 @@ class PasswordGenerator:
             groups.append(('symbol', self.symbols))
         return groups
 
-    def _pick_char(self, chars, used_chars):
-        """Pick unused character from set"""
-        available = [c for c in chars if c not in used_chars]
-        return secrets.choice(available) if available else None
+    def _build_pools(self, groups):
+        """Build disjoint per-group character pools
+
+        A character shared by several groups (e.g. custom symbols) belongs to
+        the first group only, so picks never repeat across pools. Groups left
+        empty are dropped.
+        """
+        seen = set()
+        pools = []
+        for _, chars in groups:
+            pool = [c for c in dict.fromkeys(chars) if c not in seen]
+            seen.update(pool)
+            if pool:
+                pools.append(pool)
+        return pools
+
+    @staticmethod
+    def _take_random(items):
+        """Remove and return a random element of items in O(1)
 
-    def _count_unique_chars(self, groups):
-        """Count unique characters across all groups"""
-        return len(set(c for _, chars in groups for c in chars))
+        The picked slot is overwritten with the last element and the list is
+        shortened, so the remaining elements stay contiguous.
+        """
+        index = secrets.randbelow(len(items))
+        item = items[index]
+        items[index] = items[-1]
+        items.pop()
+        return item
 
     def get_logo_path(self):
         """Get the logo path for QR code embedding"""
@@ -126,18 +207,79 @@ class PasswordGenerator:
         """Set the logo path for QR code embedding"""
         self.logo_path = path
 
-    def _shuffle_no_consecutive(self, password_chars):
-        """Shuffle ensuring no consecutive same types
+    def _max_alternating_length(self, pools):
+        """Longest length where no two neighbours share a group
+
+        A single group has nothing to alternate with, so only uniqueness
+        limits it. Otherwise the largest group can fill at most every
+        other slot around the rest.
+        """
+        capacities = sorted(len(pool) for pool in pools)
+        if len(capacities) == 1:
+            return capacities[0]
+        largest, others = capacities[-1], sum(capacities[:-1])
+        return min(largest, others + 1) + others
+
+    def _draw_group_quotas(self, pools, length):
+        """Randomly split length into per-group counts
 
-        Uses random.shuffle for better performance than manual implementation
+        Each group gets at least one slot. Extra slots are assigned one at a
+        time, weighted by the group's remaining capacity, never exceeding the
+        group size or half the password (rounded up) so an alternating
+        arrangement always exists.
         """
-        for attempt in range(MAX_GENERATION_ATTEMPTS):
-            random.shuffle(password_chars)
-            # Check if no two consecutive chars are from same type
-            if all(password_chars[i][0] != password_chars[i + 1][0]
-                   for i in range(len(password_chars) - 1)):
-                return "".join(ch for _, ch in password_chars)
-
-        # Fallback: return shuffled even if not perfect
-        random.shuffle(password_chars)
-        return "".join(ch for _, ch in password_chars)
\ No newline at end of file
+        half = (length + 1) // 2 if len(pools) > 1 else length
+        limits = [min(len(pool), half) for pool in pools]
+        quotas = [1] * len(pools)
+
+        # Weighting by remaining capacity is sampling without replacement
+        # from each group's spare slots
+        slots = [index for index, limit in enumerate(limits) for _ in range(limit - 1)]
+        for _ in range(length - len(pools)):
+            quotas[self._take_random(slots)] += 1
+
+        return quotas
+
+    def _arrange_groups(self, quotas, length):
+        """Lay out group indices so no two neighbours are equal
+
+        At every step only groups that keep the rest feasible are eligible:
+        with T slots left, the group just placed may hold at most T // 2 of
+        them and every other group at most (T + 1) // 2. Among eligible
+        groups the choice is weighted by remaining quota.
+        """
+        remaining = list(quotas)
+        if len(remaining) == 1:
+            return [0] * length
+
+        sequence = []
+        last = None
+        for left in range(length - 1, -1, -1):
+            # Largest remaining quota, and the largest excluding its owner
+            top = max(range(len(remaining)), key=remaining.__getitem__)
+            runner_up = max((c for j, c in enumerate(remaining) if j != top), default=0)
+
+            candidates = []
+            for index, count in enumerate(remaining):
+                if index == last or not count:
+                    continue
+                if count - 1 > left // 2:
+                    continue
+                if (runner_up if index == top else remaining[top]) > (left + 1) // 2:
+                    continue
+                candidates.append(index)
+
+            if not candidates:
+                raise RuntimeError("No valid character group arrangement available")
+
+            pick = secrets.randbelow(sum(remaining[i] for i in candidates))
+            for index in candidates:
+                if pick < remaining[index]:
+                    break
+                pick -= remaining[index]
+
+            sequence.append(index)
+            remaining[index] -= 1
+            last = index
+
+        return sequence
@@ -0,0 +1,23 @@
+# core/process_pool.py
+"""Process pools safe under the spawn start method (Windows, macOS)
+
+Keep this module free of app_config imports: spawned workers import it
+to run the initializer before anything else is loaded.
+"""
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+
+def redirect_stdout_to_stderr():
+    """Pool initializer: send the worker's stdout to stderr
+
+    Spawned workers re-import the modules they run, and app_config prints
+    startup messages on import. Those would otherwise land in the
+    parent's stdout, e.g. between the JSON lines of `cryptext qr import`.
+    """
+    sys.stdout = sys.stderr
+
+
+def worker_pool(max_workers):
+    """ProcessPoolExecutor whose workers write stdout to stderr"""
+    return ProcessPoolExecutor(max_workers=max_workers, initializer=redirect_stdout_to_stderr)
@@ -0,0 +1,258 @@
+# core/qr_batch_export.py
+"""Batch QR export: encode many credentials in parallel and lay them out on sheets"""
+import os
+import sys
+from collections import deque
+
+from PIL import Image, ImageDraw
+
+from app_config.app_config import (
+    QR_BORDER, QR_BATCH_CHUNK_SIZE, QR_SHEET_COLUMNS, QR_SHEET_ROWS,
+    QR_SHEET_CELL_SIZE, QR_SHEET_DPI, QR_LOGO_RATIO
+)
+from core import qr_raster, qr_vector
+from core.credential_exporter import open_private
+from core.process_pool import worker_pool
+from core.qr_handler import QRHandler, QRMatrix
+
+# One handler per worker process, created on first use
+_worker_handler = None
+
+
+def _encode_chunk(payloads, border):
+    """Encode a chunk of payloads into (width, modules bytes) pairs (worker side)"""
+    global _worker_handler
+    if _worker_handler is None:
+        _worker_handler = QRHandler()
+        _worker_handler.matrix_cache.max_entries = 0  # one-shot payloads, nothing to reuse
+
+    results = []
+    for payload in payloads:
+        matrix = _worker_handler._build_matrix(payload, border)
+        results.append((matrix.width, bytes(matrix.modules)))
+        matrix.zeroize()
+    return results
+
+
+def read_credentials(path):
+    """Stream credentials from a text file (one per line), or stdin for "-" """
+    if path == "-":
+        for line in sys.stdin:
+            line = line.rstrip("\r\n")
+            if line:
+                yield line
+        return
+
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.rstrip("\r\n")
+            if line:
+                yield line
+
+
+class QRBatchExporter:
+    """Renders many credential QR codes onto PNG, SVG or PDF sheets
+
+    PNG sheets are rasterized; SVG and PDF sheets are drawn as vectors
+    (see core.qr_vector) with the logo stored once per file. QR encoding
+    (version fit, Reed-Solomon, mask scoring) is CPU-bound pure Python,
+    so it runs across a ProcessPoolExecutor in chunks. Only a bounded
+    number of chunks are in flight at once and sheets are written page by
+    page, so memory stays flat for any number of credentials.
+
+    Sheets hold every credential in scannable form, so like exported
+    credential files they are readable by the owner only.
+    """
+
+    FORMATS = ("png", "svg", "pdf")
+
+    def __init__(self, workers=None, columns=QR_SHEET_COLUMNS, rows=QR_SHEET_ROWS,
+                 cell_size=QR_SHEET_CELL_SIZE, chunk_size=QR_BATCH_CHUNK_SIZE,
+                 logo_path=None, label_prefix="Credential", border=QR_BORDER):
+        """Initialize exporter
+
+        Args:
+            workers: Worker processes (default: CPU count)
+            columns, rows: QR codes per sheet
+            cell_size: QR edge length on the sheet in pixels
+            chunk_size: Credentials sent to a worker per task
+            logo_path: Optional logo embedded in every code
+            label_prefix: Caption under each code is "<prefix> <n>" (the
+                secret itself is never printed)
+            border: Quiet zone in modules
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.columns = columns
+        self.rows = rows
+        self.cell_size = cell_size
+        self.chunk_size = chunk_size
+        self.logo_path = logo_path
+        self.label_prefix = label_prefix
+        self.border = border
+        self.max_in_flight = self.workers * 2
+        self._handler = QRHandler()
+
+    def export(self, credentials, output, fmt=None, progress=None):
+        """Encode credentials and write sheets
+
+        Args:
+            credentials: Iterable of credential strings (consumed lazily)
+            output: Output path; PNG/SVG pages are written as
+                <stem>_001<ext>, <stem>_002<ext>, ... and PDF as one file
+            fmt: "png", "svg" or "pdf" (default: from extension)
+            progress: Optional callable(done) called after each chunk
+
+        Returns:
+            List of written file paths
+
+        Raises:
+            ValueError: If the format is unknown
+        """
+        fmt = fmt or os.path.splitext(output)[1].lower().lstrip(".")
+        if fmt not in self.FORMATS:
+            raise ValueError(f"Unsupported sheet format: {fmt}")
+
+        per_page = self.columns * self.rows
+        pdf = self._open_pdf(output) if fmt == "pdf" else None
+        written = []
+        page = []
+        done = 0
+
+        try:
+            for matrix in self._encode(credentials):
+                done += 1
+                page.append(matrix)
+                if len(page) == per_page:
+                    written.append(self._write_page(page, len(written) + 1, done - len(page), output, fmt, pdf))
+                    page = []
+                if progress and done % self.chunk_size == 0:
+                    progress(done)
+
+            if page:
+                written.append(self._write_page(page, len(written) + 1, done - len(page), output, fmt, pdf))
+        finally:
+            if pdf is not None:
+                pdf.close()
+
+        if progress:
+            progress(done)
+
+        return [output] if pdf is not None else written
+
+    def _encode(self, credentials):
+        """Yield QRMatrix objects in input order, keeping at most max_in_flight chunks pending"""
+        chunks = self._chunks(credentials)
+        with worker_pool(self.workers) as pool:
+            pending = deque()
+            for chunk in chunks:
+                pending.append(pool.submit(_encode_chunk, chunk, self.border))
+                if len(pending) >= self.max_in_flight:
+                    yield from self._matrices(pending.popleft().result())
+            while pending:
+                yield from self._matrices(pending.popleft().result())
+
+    def _chunks(self, credentials):
+        chunk = []
+        for credential in credentials:
+            chunk.append(credential)
+            if len(chunk) == self.chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    @staticmethod
+    def _matrices(results):
+        for width, modules in results:
+            yield QRMatrix(width, bytearray(modules))
+
+    # -------------------------
+    # SHEET LAYOUT
+    # -------------------------
+    def _cell_origin(self, index):
+        """Top-left pixel of the index-th cell on a page"""
+        margin = self.cell_size // 4
+        label_height = self.cell_size // 8
+        column, row = index % self.columns, index // self.columns
+        return (margin + column * (self.cell_size + margin),
+                margin + row * (self.cell_size + label_height + margin))
+
+    def _page_size(self):
+        margin = self.cell_size // 4
+        label_height = self.cell_size // 8
+        return (margin + self.columns * (self.cell_size + margin),
+                margin + self.rows * (self.cell_size + label_height + margin))
+
+    def _render_code(self, matrix):
+        """Rasterize one code at cell size, with the logo if configured"""
+        box = max(1, self.cell_size // matrix.width)
+        if not self.logo_path:
+            return qr_raster.rasterize(matrix, box, "L", self.cell_size)
+
+        img = qr_raster.rasterize(matrix, box, "RGB", self.cell_size)
+        logo_size = int(self.cell_size * QR_LOGO_RATIO)
+        cached = self._handler.logo_cache.get(self.logo_path, logo_size)
+        if cached:
+            logo, mask = cached
+            offset = (self.cell_size - logo_size) // 2
+            img.paste(logo, (offset, offset), mask=mask)
+        return img
+
+    def _label(self, first_index, position):
+        return f"{self.label_prefix} {first_index + position + 1}"
+
+    def _cells(self, matrices, first_index, scale=1):
+        """(matrix, x, y, size, label) for each code on a page, scaled from pixels"""
+        for position, matrix in enumerate(matrices):
+            x, y = self._cell_origin(position)
+            yield matrix, x * scale, y * scale, self.cell_size * scale, self._label(first_index, position)
+
+    def _vector_logo(self):
+        # cell_size pixels at QR_SHEET_DPI, like the PNG sheets
+        return self._handler._vector_logo(self.logo_path, self.cell_size)
+
+    def _open_pdf(self, output):
+        width, height = self._page_size()
+        scale = 72 / QR_SHEET_DPI
+        return qr_vector.PdfWriter(output, width * scale, height * scale, self._vector_logo(), QR_LOGO_RATIO)
+
+    def _write_page(self, matrices, page_number, first_index, output, fmt, pdf=None):
+        try:
+            if fmt == "pdf":
+                pdf.add_page(self._cells(matrices, first_index, 72 / QR_SHEET_DPI))
+                return output
+            if fmt == "svg":
+                return self._write_svg_page(matrices, page_number, first_index, output)
+            return self._write_png_page(matrices, page_number, first_index, output)
+        finally:
+            for matrix in matrices:
+                matrix.zeroize()
+
+    def _write_png_page(self, matrices, page_number, first_index, output):
+        mode = "RGB" if self.logo_path else "L"
+        page = Image.new(mode, self._page_size(), "white")
+        draw = ImageDraw.Draw(page)
+
+        for position, matrix in enumerate(matrices):
+            x, y = self._cell_origin(position)
+            page.paste(self._render_code(matrix), (x, y))
+            draw.text((x, y + self.cell_size + 2), self._label(first_index, position), fill="black")
+
+        path = self._page_path(output, page_number, ".png")
+        with open_private(path, "wb") as f:
+            page.save(f, "PNG", dpi=(QR_SHEET_DPI, QR_SHEET_DPI), optimize=True)
+        return path
+
+    def _write_svg_page(self, matrices, page_number, first_index, output):
+        width, height = self._page_size()
+        path = self._page_path(output, page_number, ".svg")
+        document = qr_vector.svg_document(self._cells(matrices, first_index), width, height,
+                                          self._vector_logo(), QR_LOGO_RATIO, max(8, self.cell_size // 12))
+        with open_private(path, "w", encoding="utf-8") as f:
+            f.write(document)
+        return path
+
+    @staticmethod
+    def _page_path(output, page_number, ext):
+        stem = os.path.splitext(output)[0]
+        return f"{stem}_{page_number:03d}{ext}"
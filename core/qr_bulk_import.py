@@ -0,0 +1,174 @@
+# core/qr_bulk_import.py
+"""Bulk QR import: decode a directory or archive of images in a process pool"""
+import json
+import os
+import tarfile
+import time
+import zipfile
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, wait
+
+from app_config.app_config import QR_IMPORT_EXTENSIONS
+from core.process_pool import worker_pool
+
+# points: corners of the code in the image, set when decoding every code per image
+ImportResult = namedtuple("ImportResult", "file payload backend elapsed_ms error points", defaults=(None,))
+
+# One handler per worker process, created on first use
+_worker_handler = None
+
+
+def _decode_item(name, source, multi=False):
+    """Decode one image (worker side)
+
+    Args:
+        name: Display name (path, or member name inside an archive)
+        source: File path (str) or image file contents (bytes)
+        multi: Decode every code in the image, not just the first
+
+    Returns:
+        List of ImportResult (one per code in multi mode)
+    """
+    global _worker_handler
+    if _worker_handler is None:
+        from core.qr_handler import QRHandler
+        _worker_handler = QRHandler()
+
+    from core.qr_decoders import read_gray, read_gray_bytes
+
+    start = time.perf_counter()
+    try:
+        cv2 = _worker_handler.cv2
+        image = read_gray_bytes(source, cv2) if isinstance(source, bytes) else read_gray(source, cv2)
+        if multi:
+            detections = _worker_handler.decode_image_multi(image)
+        else:
+            result = _worker_handler.decode_image(image)
+    except Exception as e:
+        return [ImportResult(name, None, None, (time.perf_counter() - start) * 1000, str(e))]
+
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    if multi:
+        if not detections:
+            return [ImportResult(name, None, None, elapsed_ms, "No QR code found")]
+        return [ImportResult(name, d.text, d.backend, elapsed_ms, None, d.points) for d in detections]
+
+    if result is None:
+        return [ImportResult(name, None, None, elapsed_ms, "No QR code found")]
+    return [ImportResult(name, result.text, result.backend, elapsed_ms, None)]
+
+
+def is_image(name):
+    return os.path.splitext(name)[1].lower() in QR_IMPORT_EXTENSIONS
+
+
+def iter_sources(source):
+    """Yield (name, path_or_bytes) for every image in a directory or archive
+
+    Directories are walked recursively and yield paths; .zip and tar
+    archives yield member contents one at a time, so nothing is extracted
+    to disk.
+    """
+    if os.path.isdir(source):
+        for root, dirs, files in os.walk(source):
+            dirs.sort()
+            for filename in sorted(files):
+                if is_image(filename):
+                    path = os.path.join(root, filename)
+                    yield path, path
+    elif zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as archive:
+            for info in archive.infolist():
+                if not info.is_dir() and is_image(info.filename):
+                    yield info.filename, archive.read(info)
+    elif tarfile.is_tarfile(source):
+        with tarfile.open(source) as archive:
+            for member in archive:
+                if member.isfile() and is_image(member.name):
+                    yield member.name, archive.extractfile(member).read()
+    elif os.path.isfile(source) and is_image(source):
+        yield source, source
+    else:
+        raise ValueError(f"Not a directory, archive or image: {source}")
+
+
+class QRBulkImporter:
+    """Decodes many QR images across a ProcessPoolExecutor
+
+    Results are yielded as they complete. At most max_in_flight images are
+    submitted at a time, which bounds memory for archives (whose members
+    are sent to workers as bytes). Setting the cancel event stops new
+    submissions, drops queued work and ends the iteration.
+    """
+
+    def __init__(self, workers=None, max_in_flight=None, multi=False):
+        """Initialize importer
+
+        Args:
+            workers: Worker processes (default: CPU count)
+            max_in_flight: Images submitted but not yet finished
+            multi: Report every code in each image (e.g. photographed
+                sheets) with its corner points, instead of the first one
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.max_in_flight = max_in_flight or self.workers * 4
+        self.multi = multi
+
+    def run(self, source, cancel_event=None):
+        """Decode every image under source
+
+        Args:
+            source: Directory, .zip/.tar archive, or single image path
+            cancel_event: Optional threading.Event; set it to stop early
+
+        Yields:
+            ImportResult(file, payload, backend, elapsed_ms, error, points)
+        """
+        items = iter_sources(source)
+        pool = worker_pool(self.workers)
+        pending = set()
+        cancelled = False
+
+        try:
+            exhausted = False
+            while True:
+                while not exhausted and len(pending) < self.max_in_flight:
+                    if cancel_event is not None and cancel_event.is_set():
+                        cancelled = True
+                        return
+                    item = next(items, None)
+                    if item is None:
+                        exhausted = True
+                        break
+                    pending.add(pool.submit(_decode_item, *item, self.multi))
+
+                if not pending:
+                    return
+
+                done, pending = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+
+                if cancel_event is not None and cancel_event.is_set():
+                    cancelled = True
+                    return
+        finally:
+            items.close()
+            pool.shutdown(wait=not cancelled, cancel_futures=True)
+
+
+def write_jsonl(results, f):
+    """Write ImportResults to an open text file as JSON lines
+
+    Returns:
+        (decoded, failed) counts
+    """
+    decoded = failed = 0
+    for result in results:
+        f.write(json.dumps(result._asdict(), ensure_ascii=False))
+        f.write("\n")
+        if result.error:
+            failed += 1
+        else:
+            decoded += 1
+    return decoded, failed
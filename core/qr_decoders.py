@@ -0,0 +1,308 @@
+# core/qr_decoders.py
+"""QR decoder registry: long-lived backend instances with adaptive ordering"""
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+# stage/timings are filled in by core.qr_preprocess.PreprocessPipeline
+DecodeResult = namedtuple("DecodeResult", "text backend elapsed_ms stage timings", defaults=(None, ()))
+
+# One code found by a multi-code scan; points are its 4 corners in image pixels
+QRDetection = namedtuple("QRDetection", "text points backend")
+
+
+class DecoderBackend:
+    """One way of decoding a grayscale NumPy image
+
+    Subclasses create their detector lazily, once per thread (OpenCV
+    detector objects must not be shared between threads).
+    """
+
+    name = "base"
+    expected_ms = 20.0  # latency assumed before any measurement
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def available(self):
+        return True
+
+    def decode(self, image):
+        """Return the decoded text, or None"""
+        raise NotImplementedError
+
+    def decode_multi(self, image):
+        """Return [(text, corner points)] for every code read in the image"""
+        return []
+
+    def _detector(self):
+        detector = getattr(self._local, "detector", None)
+        if detector is None:
+            detector = self._local.detector = self._create_detector()
+        return detector
+
+    def _create_detector(self):
+        return None
+
+
+class OpenCVDecoder(DecoderBackend):
+    """cv2.QRCodeDetector (classic finder-pattern detector)"""
+
+    name = "opencv"
+    expected_ms = 15.0
+
+    def __init__(self, cv2):
+        super().__init__()
+        self.cv2 = cv2
+
+    def decode(self, image):
+        text, _, _ = self._detector().detectAndDecode(image)
+        return text or None
+
+    def decode_multi(self, image):
+        ok, texts, points, _ = self._detector().detectAndDecodeMulti(image)
+        if not ok or points is None:
+            return []
+        return [(text, corners.reshape(-1, 2).tolist()) for text, corners in zip(texts, points) if text]
+
+    def locate_multi(self, image):
+        """Corner arrays of every code found (without decoding)"""
+        ok, points = self._detector().detectMulti(image)
+        if not ok or points is None:
+            return []
+        return [corners.reshape(-1, 2) for corners in points]
+
+    def _create_detector(self):
+        return self.cv2.QRCodeDetector()
+
+
+class ArucoDecoder(OpenCVDecoder):
+    """cv2.QRCodeDetectorAruco: slower, but reads high versions the classic one misses"""
+
+    name = "aruco"
+    expected_ms = 40.0
+
+    def available(self):
+        return hasattr(self.cv2, "QRCodeDetectorAruco")
+
+    def _create_detector(self):
+        return self.cv2.QRCodeDetectorAruco()
+
+
+class ZBarDecoder(DecoderBackend):
+    """pyzbar (needs the zbar shared library)"""
+
+    name = "zbar"
+    expected_ms = 10.0
+
+    def __init__(self, zbar_decode):
+        super().__init__()
+        self.zbar_decode = zbar_decode
+
+    def available(self):
+        return self.zbar_decode is not None
+
+    def decode(self, image):
+        results = self.zbar_decode(image)
+        if results:
+            return results[0].data.decode("utf-8", errors="replace")
+        return None
+
+    def decode_multi(self, image):
+        return [
+            (result.data.decode("utf-8", errors="replace"), [(p.x, p.y) for p in result.polygon])
+            for result in self.zbar_decode(image)
+        ]
+
+
+class _BackendStats:
+    __slots__ = ("attempts", "successes", "total_ms")
+
+    def __init__(self):
+        self.attempts = 0
+        self.successes = 0
+        self.total_ms = 0.0
+
+
+class DecoderRegistry:
+    """Runs the available decoder backends in their most promising order
+
+    For each backend the registry tracks attempts, successes and time spent,
+    and orders backends by expected cost per successful decode (mean latency
+    divided by success rate, both Laplace-smoothed so untried backends start
+    from their expected_ms). With race=True all backends run concurrently
+    and the first successful result wins; OpenCV and pyzbar release the GIL,
+    so this helps on multi-core machines when one backend is much faster on
+    a given image.
+    """
+
+    def __init__(self, backends):
+        self.backends = [backend for backend in backends if backend.available()]
+        self._stats = {backend.name: _BackendStats() for backend in self.backends}
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def ordered(self):
+        """Backends sorted by expected cost per success (cheapest first)"""
+        with self._lock:
+            return sorted(self.backends, key=self._score)
+
+    def decode(self, image, race=False):
+        """Decode a grayscale NumPy image
+
+        Args:
+            image: 2-D uint8 array (read once, shared by all backends)
+            race: Run all backends concurrently and take the first result
+
+        Returns:
+            DecodeResult, or None if no backend could read the image
+        """
+        if image is None:
+            return None
+        if race and len(self.backends) > 1:
+            return self._race(image)
+
+        for backend in self.ordered():
+            result = self._run(backend, image)
+            if result:
+                return result
+        return None
+
+    def decode_multi(self, image):
+        """Read every code in a grayscale image with all backends
+
+        Results from different backends are merged: the same text found at
+        roughly the same place counts once (the same text printed twice in
+        different places is kept twice).
+
+        Returns:
+            List of QRDetection in reading order
+        """
+        if image is None:
+            return []
+
+        detections = []
+        for backend in self.ordered():
+            start = time.perf_counter()
+            try:
+                found = backend.decode_multi(image)
+            except Exception:
+                found = []
+            self._record(backend, (time.perf_counter() - start) * 1000, bool(found))
+
+            for text, points in found:
+                if not any(d.text == text and same_place(d.points, points) for d in detections):
+                    detections.append(QRDetection(text, [tuple(map(float, p)) for p in points], backend.name))
+
+        return reading_order(detections)
+
+    def stats(self):
+        """Per-backend counters: attempts, successes, mean_ms"""
+        with self._lock:
+            return {
+                name: {
+                    "attempts": s.attempts,
+                    "successes": s.successes,
+                    "mean_ms": s.total_ms / s.attempts if s.attempts else None,
+                }
+                for name, s in self._stats.items()
+            }
+
+    def _score(self, backend):
+        s = self._stats[backend.name]
+        mean_ms = (s.total_ms + backend.expected_ms) / (s.attempts + 1)
+        success_rate = (s.successes + 1) / (s.attempts + 2)
+        return mean_ms / success_rate
+
+    def _run(self, backend, image):
+        start = time.perf_counter()
+        try:
+            text = backend.decode(image)
+        except Exception:
+            text = None
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self._record(backend, elapsed_ms, bool(text))
+        return DecodeResult(text, backend.name, elapsed_ms) if text else None
+
+    def _record(self, backend, elapsed_ms, success):
+        with self._lock:
+            s = self._stats[backend.name]
+            s.attempts += 1
+            s.total_ms += elapsed_ms
+            if success:
+                s.successes += 1
+
+    def _race(self, image):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=len(self.backends),
+                                                thread_name_prefix="qr-decode")
+
+        pending = {self._executor.submit(self._run, backend, image) for backend in self.ordered()}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                if result:
+                    return result  # losers finish in the background and still update stats
+        return None
+
+
+def _center(points):
+    return (sum(p[0] for p in points) / len(points), sum(p[1] for p in points) / len(points))
+
+
+def same_place(a, b):
+    """True if two corner sets overlap by more than half the code size"""
+    (ax, ay), (bx, by) = _center(a), _center(b)
+    size = max(max(p[0] for p in a) - min(p[0] for p in a), max(p[1] for p in a) - min(p[1] for p in a))
+    return abs(ax - bx) < size / 2 and abs(ay - by) < size / 2
+
+
+def reading_order(detections):
+    """Sort detections row by row, left to right (rows ~ one code height apart)"""
+    if not detections:
+        return detections
+    heights = sorted(max(p[1] for p in d.points) - min(p[1] for p in d.points) for d in detections)
+    row_height = max(1.0, heights[len(heights) // 2])
+    return sorted(detections, key=lambda d: (int(_center(d.points)[1] // row_height), _center(d.points)[0]))
+
+
+def read_gray(filename, cv2):
+    """Read an image file once as a grayscale NumPy array
+
+    Uses cv2.imread, falling back to PIL for formats OpenCV cannot open.
+
+    Returns:
+        2-D uint8 array, or None if the file is not a readable image
+    """
+    image = cv2.imread(filename, cv2.IMREAD_GRAYSCALE)
+    if image is not None:
+        return image
+
+    try:
+        import numpy as np
+        from PIL import Image
+
+        with Image.open(filename) as img:
+            return np.asarray(img.convert("L"))
+    except Exception:
+        return None
+
+
+def read_gray_bytes(data, cv2):
+    """Like read_gray, for image file contents already in memory"""
+    import numpy as np
+
+    image = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_GRAYSCALE)
+    if image is not None:
+        return image
+
+    try:
+        from io import BytesIO
+        from PIL import Image
+
+        with Image.open(BytesIO(data)) as img:
+            return np.asarray(img.convert("L"))
+    except Exception:
+        return None
@@ -1,81 +1,470 @@
 # core/qr_handler.py
 """QR code generation and scanning operations"""
+import os
+import hashlib
+import hmac
+import logging
+import secrets
+import threading
+import time
+from collections import OrderedDict
 import qrcode
-from PyQt5.QtGui import QPixmap, QImage
-from PyQt5.QtCore import QBuffer as QtBuffer, QIODevice, QByteArray
-from PyQt5.QtGui import QPixmap, QImage
 from PIL import Image
 from io import BytesIO
-import cv2
-from pyzbar.pyzbar import decode
+from core import qr_raster, qr_vector
+from core.qr_decoders import DecoderRegistry, OpenCVDecoder, ZBarDecoder, ArucoDecoder, read_gray
+from core.qr_preprocess import PreprocessPipeline
 from app_config.app_config import (
     QR_VERSION, QR_ERROR_CORRECTION, QR_BOX_SIZE,
-    QR_BORDER, QR_LOGO_RATIO
+    QR_BORDER, QR_LOGO_RATIO, QR_LOGO_CACHE_SIZE, QR_MATRIX_CACHE_SIZE,
+    QR_VECTOR_LOGO_SIZE, QR_DECODE_RACE
 )
 
 
+class QRMatrix:
+    """Square QR module matrix, border included
+
+    Modules are stored flat, row-major, as one byte each (1 = dark) in a
+    bytearray, so the matrix can be wiped in place once it is no longer
+    needed.
+    """
+
+    __slots__ = ("width", "modules")
+
+    def __init__(self, width, modules):
+        self.width = width
+        self.modules = modules
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Build from qrcode's get_matrix() rows of bools"""
+        return cls(len(rows), bytearray(1 if dark else 0 for row in rows for dark in row))
+
+    def zeroize(self):
+        """Overwrite the module data in place"""
+        self.modules[:] = bytes(len(self.modules))
+
+
+class QRMatrixCache:
+    """Bounded in-memory LRU of encoded QR matrices
+
+    Re-rendering the same credential (visibility toggles, mode switches,
+    saving) skips the qrcode pipeline entirely. Payloads are secrets, so:
+    entries are keyed by an HMAC of the payload under a random per-process
+    key (never the payload itself), nothing is ever written to disk, and
+    matrices are zeroized on eviction and on clear().
+    """
+
+    def __init__(self, max_entries=QR_MATRIX_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._key = secrets.token_bytes(32)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def make_key(self, data, border):
+        """Cache key: keyed payload digest plus every encoding setting"""
+        digest = hmac.new(self._key, data.encode("utf-8"), hashlib.sha256).digest()
+        return digest, QR_VERSION, QR_ERROR_CORRECTION, border
+
+    def get(self, key):
+        """Return the cached QRMatrix for key, or None"""
+        with self._lock:
+            matrix = self._entries.get(key)
+            if matrix is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return matrix
+
+    def put(self, key, matrix):
+        """Store a matrix, zeroizing whatever falls off the LRU end"""
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None and previous is not matrix:
+                previous.zeroize()
+            self._entries[key] = matrix
+            while len(self._entries) > self.max_entries:
+                _, evicted = self._entries.popitem(last=False)
+                evicted.zeroize()
+
+    def clear(self):
+        """Zeroize and drop every cached matrix"""
+        with self._lock:
+            for matrix in self._entries.values():
+                matrix.zeroize()
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class LogoCache:
+    """Bounded LRU of logos scaled and ready to paste onto QR codes
+
+    Entries are keyed by (path, size, mtime), so editing the logo file on
+    disk invalidates it. Each entry holds the RGBA image and its alpha mask;
+    a logo that failed to load is cached as None so it is not retried on
+    every render.
+    """
+
+    def __init__(self, max_entries=QR_LOGO_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, logo_path, size):
+        """Return (rgba_image, mask) for logo_path scaled to size, or None"""
+        key = (logo_path, size, self._mtime(logo_path))
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        entry = self._load(logo_path, size)
+
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def clear(self):
+        """Drop all cached logos"""
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def _mtime(logo_path):
+        if logo_path.startswith(":/"):
+            return None  # Qt resources are immutable for the process lifetime
+        try:
+            return os.stat(logo_path).st_mtime_ns
+        except OSError:
+            return None
+
+    @staticmethod
+    def _load(logo_path, size):
+        """Decode and scale a logo once (plain files via PIL, :/ via Qt)"""
+        try:
+            if not logo_path.startswith(":/") and os.path.isfile(logo_path):
+                logo = Image.open(logo_path).convert("RGBA")
+            else:
+                # Qt resource: QImage is thread-safe, unlike QPixmap
+                from PyQt5.QtGui import QImage
+                from PyQt5.QtCore import QBuffer as QtBuffer, QIODevice
+
+                qimage = QImage(logo_path)
+                if qimage.isNull():
+                    return None
+
+                buffer = QtBuffer()
+                buffer.open(QIODevice.ReadWrite)
+                qimage.save(buffer, "PNG")
+                image_bytes = bytes(buffer.data())
+                buffer.close()
+                logo = Image.open(BytesIO(image_bytes)).convert("RGBA")
+
+            logo = logo.resize((size, size), Image.LANCZOS)
+            return logo, logo.getchannel("A")
+        except Exception:
+            return None
+
+
 class QRHandler:
-    """Handles QR code generation and scanning"""
+    """Handles QR code generation and scanning
+
+    OpenCV and pyzbar are only needed for scanning, so they are imported on
+    first use (or ahead of time via prewarm) rather than at module import.
+    """
+
+    def __init__(self):
+        self._cv2 = None
+        self._zbar_decode = None
+        self._backends_ready = False
+        self._decoders = None
+        self._preprocessor = None
+        self._backend_lock = threading.Lock()
+        self.backend_load_time = None  # seconds spent importing scan backends
+        self.logo_cache = LogoCache()
+        self.matrix_cache = QRMatrixCache()
+
+    @property
+    def cv2(self):
+        """OpenCV module, imported on first access"""
+        if not self._backends_ready:
+            self._load_backends()
+        return self._cv2
+
+    @property
+    def zbar_decode(self):
+        """pyzbar decode function, imported on first access (None if zbar is missing)"""
+        if not self._backends_ready:
+            self._load_backends()
+        return self._zbar_decode
+
+    @property
+    def decoders(self):
+        """DecoderRegistry over the available backends, built once"""
+        if self._decoders is None:
+            cv2 = self.cv2
+            self._decoders = DecoderRegistry([
+                OpenCVDecoder(cv2), ZBarDecoder(self.zbar_decode), ArucoDecoder(cv2)
+            ])
+        return self._decoders
 
-    def generate(self, data, logo_path=None):
-        """Generate QR code with optional logo"""
+    @property
+    def preprocessor(self):
+        """PreprocessPipeline feeding image variants to the decoders"""
+        if self._preprocessor is None:
+            self._preprocessor = PreprocessPipeline(self.cv2, self.decoders)
+        return self._preprocessor
+
+    def backends_loaded(self):
+        """Check whether the scanning backends have been imported"""
+        return self._backends_ready
+
+    def prewarm(self, on_done=None):
+        """Import scanning backends on a background thread
+
+        Args:
+            on_done: Optional callable(error) run on the loader thread once
+                loading finishes; error is None on success
+        """
+        def _run():
+            error = None
+            try:
+                self._load_backends()
+            except Exception as e:
+                error = e
+            if on_done:
+                on_done(error)
+
+        threading.Thread(target=_run, name="qr-backend-prewarm", daemon=True).start()
+
+    def _load_backends(self):
+        """Import and configure OpenCV and pyzbar (thread-safe, once)"""
+        with self._backend_lock:
+            if self._backends_ready:
+                return
+
+            start = time.perf_counter()
+
+            # Must be set before cv2 is imported to take effect
+            os.environ.setdefault("OPENCV_VIDEOIO_PRIORITY_MSMF", "0")
+            import cv2
+            try:
+                if hasattr(cv2, "setLogLevel"):
+                    cv2.setLogLevel(cv2.LOG_LEVEL_SILENT)
+            except Exception:
+                pass
+
+            logging.getLogger("pyzbar").setLevel(logging.ERROR)
+            try:
+                from pyzbar.pyzbar import decode
+            except ImportError:  # pyzbar or the zbar library missing: OpenCV only
+                decode = None
+
+            self._cv2 = cv2
+            self._zbar_decode = decode
+            self._backends_ready = True
+            self.backend_load_time = time.perf_counter() - start
+
+    def generate(self, data, logo_path=None, size=None, border=None):
+        """Generate QR code with optional logo
+
+        Args:
+            data: Text to encode
+            logo_path: Optional logo embedded in the center
+            size: Render straight to a size x size image (whole-pixel modules,
+                centered on white) instead of QR_BOX_SIZE pixels per module
+            border: Quiet zone in modules (default: QR_BORDER)
+
+        Returns:
+            PIL RGB image, or None if data is blank
+        """
         if not data.strip():
             return None
 
+        matrix = self._get_matrix(data, QR_BORDER if border is None else border)
+        qr_img = self._rasterize(matrix, size)
+
+        if logo_path:
+            qr_img = self._embed_logo(qr_img, logo_path)
+
+        return qr_img
+
+    def clear_cache(self):
+        """Zeroize cached QR matrices (call whenever credentials are cleared)"""
+        self.matrix_cache.clear()
+
+    def _get_matrix(self, data, border):
+        """Module matrix for data, from matrix_cache when possible"""
+        key = self.matrix_cache.make_key(data, border)
+        matrix = self.matrix_cache.get(key)
+        if matrix is None:
+            matrix = self._build_matrix(data, border)
+            self.matrix_cache.put(key, matrix)
+        return matrix
+
+    def _build_matrix(self, data, border):
+        """Encode data into a QRMatrix (border included)"""
         qr = qrcode.QRCode(
             version=QR_VERSION,
             error_correction=getattr(qrcode.constants, f"ERROR_CORRECT_{QR_ERROR_CORRECTION}"),
-            box_size=QR_BOX_SIZE,
-            border=QR_BORDER,
+            box_size=1,
+            border=border,
         )
         qr.add_data(data)
         qr.make(fit=True)
-        qr_img = qr.make_image(fill_color="black", back_color="white").convert("RGB")
+        return QRMatrix.from_rows(qr.get_matrix())
 
-        if logo_path:
-            qr_img = self._embed_logo(qr_img, logo_path)
+    def generate_qimage(self, data, size, border=None):
+        """Render data straight to a size x size grayscale QImage (no logo)
 
-        return qr_img
+        Skips PIL entirely when NumPy is available.
+        """
+        if not data.strip():
+            return None
 
-    def _embed_logo(self, qr_img, logo_path):
-        """Embed logo in center of QR code"""
-        try:
-            pixmap = QPixmap(logo_path)
-            if pixmap.isNull():
-                return qr_img
+        matrix = self._get_matrix(data, QR_BORDER if border is None else border)
+        return qr_raster.to_qimage(matrix, self._box_size(matrix, size), size)
+
+    def generate_svg(self, data, logo_path=None, size=None, border=None):
+        """Render data as an SVG document without rasterizing
+
+        Dark modules are merged into horizontal runs of a single path; the
+        logo, if any, is embedded once and placed by reference.
+
+        Args:
+            data: Text to encode
+            logo_path: Optional logo embedded in the center
+            size: Edge length in user units (default: QR_BOX_SIZE per module)
+            border: Quiet zone in modules (default: QR_BORDER)
+
+        Returns:
+            SVG markup, or None if data is blank
+        """
+        if not data.strip():
+            return None
 
-            qimage = pixmap.toImage()
-            buffer = QtBuffer()
-            buffer.open(QIODevice.ReadWrite)
-            qimage.save(buffer, "PNG")
-            image_bytes = buffer.data()
-            buffer.close()
+        matrix = self._get_matrix(data, QR_BORDER if border is None else border)
+        size = size or matrix.width * QR_BOX_SIZE
+        return qr_vector.svg_document([(matrix, 0, 0, size, None)], size, size,
+                                      self._vector_logo(logo_path, size), QR_LOGO_RATIO)
 
-            pil_logo = Image.open(BytesIO(image_bytes)).convert("RGBA")
+    def save_pdf(self, data, path, logo_path=None, size=None, border=None):
+        """Write data as a single-page vector PDF
 
+        Args:
+            data: Text to encode
+            path: Output file path
+            logo_path: Optional logo embedded in the center
+            size: Page edge in points (default: QR_BOX_SIZE per module)
+            border: Quiet zone in modules (default: QR_BORDER)
+
+        Returns:
+            True if written, False if data is blank
+        """
+        if not data.strip():
+            return False
+
+        matrix = self._get_matrix(data, QR_BORDER if border is None else border)
+        size = size or matrix.width * QR_BOX_SIZE
+        with qr_vector.PdfWriter(path, size, size, self._vector_logo(logo_path, size), QR_LOGO_RATIO) as pdf:
+            pdf.add_page([(matrix, 0, 0, size, None)])
+        return True
+
+    def _vector_logo(self, logo_path, code_size):
+        """RGBA logo for vector output, or None
+
+        Embedded at the pixel size it is printed at on a code_size code (as
+        in the raster output) unless QR_VECTOR_LOGO_SIZE asks for more.
+        """
+        if not logo_path:
+            return None
+        pixels = QR_VECTOR_LOGO_SIZE or max(1, int(code_size * QR_LOGO_RATIO))
+        cached = self.logo_cache.get(logo_path, pixels)
+        return cached[0] if cached else None
+
+    @staticmethod
+    def _box_size(matrix, size):
+        """Whole pixels per module: QR_BOX_SIZE, or the most that fit in size"""
+        return QR_BOX_SIZE if size is None else max(1, size // matrix.width)
+
+    def _rasterize(self, matrix, size=None):
+        """Draw a module matrix as an RGB image (vectorized, see core.qr_raster)"""
+        return qr_raster.rasterize(matrix, self._box_size(matrix, size), "RGB", size)
+
+    def _embed_logo(self, qr_img, logo_path):
+        """Embed logo in center of QR code (scaled logo comes from logo_cache)"""
+        try:
             qr_width, qr_height = qr_img.size
             logo_size = int(min(qr_width, qr_height) * QR_LOGO_RATIO)
-            pil_logo = pil_logo.resize((logo_size, logo_size), Image.LANCZOS)
+            cached = self.logo_cache.get(logo_path, logo_size)
+            if cached is None:
+                return qr_img
+
+            logo, mask = cached
             pos = ((qr_width - logo_size) // 2, (qr_height - logo_size) // 2)
-            qr_img.paste(pil_logo, pos, mask=pil_logo)
+            qr_img.paste(logo, pos, mask=mask)
         except Exception:
             pass  # Return QR without logo on error
 
         return qr_img
 
-    def to_pixmap(self, qr_img, size):
-        """Convert QR image to QPixmap"""
+    def to_qimage(self, qr_img, size):
+        """Wrap a QR image as a QImage without a PNG encode/decode round trip
+
+        The QImage points straight at the PIL pixel bytes, which are kept
+        alive on it as _pixel_data. Images that are not already size x size
+        are scaled nearest-neighbour to keep module edges sharp. Thread-safe,
+        unlike QPixmap.
+        """
         if not qr_img:
             return None
 
-        buffer = BytesIO()
-        qr_img.save(buffer, format="PNG")
-        pixmap = QPixmap()
-        pixmap.loadFromData(buffer.getvalue())
-        return pixmap.scaled(size, size)
+        from PyQt5.QtGui import QImage
+
+        if qr_img.size != (size, size):
+            qr_img = qr_img.resize((size, size), Image.NEAREST)
+
+        if qr_img.mode == "RGBA":
+            fmt, channels = QImage.Format_RGBA8888, 4
+        elif qr_img.mode == "L":
+            fmt, channels = QImage.Format_Grayscale8, 1
+        else:
+            qr_img = qr_img.convert("RGB")
+            fmt, channels = QImage.Format_RGB888, 3
+
+        data = qr_img.tobytes()
+        qimage = QImage(data, qr_img.width, qr_img.height, qr_img.width * channels, fmt)
+        qimage._pixel_data = data
+        return qimage
+
+    def to_pixmap(self, qr_img, size):
+        """Convert QR image to QPixmap (GUI thread only)"""
+        qimage = self.to_qimage(qr_img, size)
+        if qimage is None:
+            return None
+
+        from PyQt5.QtGui import QPixmap
+
+        return QPixmap.fromImage(qimage)
 
     def scan_from_camera(self, camera_index=0):
-        """Scan QR from camera"""
+        """Scan QR from camera (blocking OpenCV window; the GUI uses ui.camera_scanner)"""
+        cv2 = self.cv2
         cap = cv2.VideoCapture(camera_index)
         decoded_text = None
 
@@ -85,14 +474,11 @@ class QRHandler:
                 if not ret:
                     break
 
-                decoded_objects = decode(frame)
-                for obj in decoded_objects:
-                    decoded_text = obj.data.decode('utf-8')
-                    x, y, w, h = obj.rect
-                    cv2.rectangle(frame, (x, y), (x + w, y + h), (0, 255, 0), 2)
-                    cv2.putText(frame, "QR Detected", (x, y - 10),
+                result = self.decoders.decode(cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY))
+                if result:
+                    decoded_text = result.text
+                    cv2.putText(frame, "QR Detected", (10, 30),
                                 cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
-                    break
 
                 cv2.imshow("QR Scanner (Press Q to cancel)", frame)
 
@@ -106,21 +492,33 @@ class QRHandler:
 
     def scan_from_file(self, filename):
         """Scan QR from image file"""
-        # Try OpenCV first
-        image = cv2.imread(filename)
-        if image is not None:
-            detector = cv2.QRCodeDetector()
-            data, _, _ = detector.detectAndDecode(image)
-            if data:
-                return data
-
-        # Fallback to pyzbar
-        try:
-            img = Image.open(filename)
-            decoded_objects = decode(img)
-            if decoded_objects:
-                return decoded_objects[0].data.decode("utf-8")
-        except Exception:
-            pass
+        result = self.decode_file(filename)
+        return result.text if result else None
+
+    def decode_file(self, filename, race=QR_DECODE_RACE):
+        """Decode an image file, reading it only once
+
+        Args:
+            filename: Image path
+            race: Run all decoder backends concurrently (see DecoderRegistry)
+
+        Returns:
+            DecodeResult (text, backend, elapsed_ms, stage, timings), or None
+        """
+        return self.decode_image(read_gray(filename, self.cv2), race)
+
+    def scan_all_from_file(self, filename):
+        """Decode every QR code in an image file (e.g. a photographed sheet)
+
+        Returns:
+            List of QRDetection (text, corner points, backend) in reading order
+        """
+        return self.decode_image_multi(read_gray(filename, self.cv2))
+
+    def decode_image_multi(self, image):
+        """Decode every QR code in a grayscale NumPy image"""
+        return self.preprocessor.decode_multi(image)
 
-        return None
\ No newline at end of file
+    def decode_image(self, image, race=QR_DECODE_RACE):
+        """Decode a grayscale NumPy image through the preprocessing stages"""
+        return self.preprocessor.decode(image, race=race)
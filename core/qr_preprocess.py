@@ -0,0 +1,188 @@
+# core/qr_preprocess.py
+"""QR decode preprocessing: cheap image variants first, escalate on failure"""
+import time
+
+from app_config.app_config import QR_DECODE_MAX_SIDE, QR_DECODE_MIN_SIDE
+from core.qr_decoders import DecodeResult, QRDetection, OpenCVDecoder, ArucoDecoder, reading_order, same_place
+
+
+class PreprocessPipeline:
+    """Tries progressively more expensive variants of a grayscale image
+
+    Stages, in order (each only if the previous ones failed):
+
+        native /    the image as is, or shrunk to QR_DECODE_MAX_SIDE when
+        downscale   larger (large photos)
+        roi         code located on a two-level pyramid (the small image,
+                    then twice its size) and decoded at full resolution
+                    inside that region only
+        threshold   adaptive threshold of the small image or ROI (uneven
+                    lighting, low contrast)
+        upscale     images smaller than QR_DECODE_MIN_SIDE enlarged 2x
+                    (tiny or blurry codes)
+        full        native resolution, the old behaviour, as a last resort
+
+    Every attempted stage is recorded with its time in the result's
+    timings, so slow or failing inputs can be diagnosed.
+    """
+
+    def __init__(self, cv2, registry):
+        self.cv2 = cv2
+        self.registry = registry
+        # The Aruco detector locates small codes faster and more reliably
+        aruco = ArucoDecoder(cv2)
+        self._locator = aruco if aruco.available() else OpenCVDecoder(cv2)
+        self.last_timings = ()
+
+    def decode(self, image, race=False):
+        """Decode a grayscale image
+
+        Returns:
+            DecodeResult with stage and timings set, or None. When nothing
+            decodes, timings are still available from last_timings.
+        """
+        if image is None:
+            return None
+
+        timings = []
+        started = time.perf_counter()
+        for stage, variant in self._variants(image, timings):
+            stage_start = time.perf_counter()
+            result = self.registry.decode(variant, race=race)
+            timings.append((stage, (time.perf_counter() - stage_start) * 1000, bool(result)))
+            if result:
+                return DecodeResult(result.text, result.backend,
+                                    (time.perf_counter() - started) * 1000, stage, tuple(timings))
+
+        self.last_timings = tuple(timings)
+        return None
+
+    def decode_multi(self, image):
+        """Find and decode every QR code in a grayscale image
+
+        All codes are located in one pass with detectMulti on the pyramid
+        levels, then each full-resolution crop goes through decode(). A
+        level is only added when the previous one missed codes.
+
+        Returns:
+            List of QRDetection (corners in image pixels) in reading order
+        """
+        if image is None:
+            return []
+
+        cv2 = self.cv2
+        height, width = image.shape[:2]
+        longest = max(height, width)
+        detections = []
+        located = []
+
+        for side in (QR_DECODE_MAX_SIDE, QR_DECODE_MAX_SIDE * 2):
+            scale = min(1.0, side / longest)
+            level = image if scale == 1.0 else cv2.resize(
+                image, (int(width * scale), int(height * scale)), interpolation=cv2.INTER_AREA
+            )
+            try:
+                found = [corners / scale for corners in self._locator.locate_multi(level)]
+            except Exception:
+                found = []
+
+            missed = 0
+            for corners in found:
+                points = corners.tolist()
+                if any(same_place(seen, points) for seen in located):
+                    continue
+                located.append(points)
+
+                region = self._region(corners, width, height)
+                result = self.decode(image[region[1]:region[3], region[0]:region[2]]) if region else None
+                if result:
+                    detections.append(QRDetection(result.text, [tuple(p) for p in points], result.backend))
+                else:
+                    missed += 1
+
+            if (found and not missed) or scale == 1.0:
+                break
+
+        if not detections:
+            # Nothing located: let every backend try the whole image
+            detections = self.registry.decode_multi(image)
+        return reading_order(detections)
+
+    def _variants(self, image, timings):
+        """Yield (stage, image) lazily, so later variants cost nothing when an early one decodes"""
+        cv2 = self.cv2
+        height, width = image.shape[:2]
+        longest = max(height, width)
+
+        small, scale = image, 1.0
+        if longest > QR_DECODE_MAX_SIDE:
+            scale = QR_DECODE_MAX_SIDE / longest
+            small = cv2.resize(image, (max(1, int(width * scale)), max(1, int(height * scale))),
+                               interpolation=cv2.INTER_AREA)
+            yield "downscale", small
+        else:
+            yield "native", image
+
+        region = None
+        if scale < 1.0:
+            region = self._locate(image, small, timings)
+            if region is not None:
+                x0, y0, x1, y1 = region
+                region = image[y0:y1, x0:x1]
+                yield "roi", region
+
+        target = region if region is not None else small
+        yield "threshold", cv2.adaptiveThreshold(target, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
+                                                 cv2.THRESH_BINARY, 31, 5)
+
+        if longest < QR_DECODE_MIN_SIDE:
+            yield "upscale", cv2.resize(image, (width * 2, height * 2), interpolation=cv2.INTER_CUBIC)
+
+        if scale < 1.0:
+            yield "full", image
+
+    def _locate(self, image, small, timings):
+        """Find the code on pyramid levels (small image, then twice its size)
+
+        Returns:
+            Bounding box in full-resolution pixels, padded 15%, or None
+        """
+        cv2 = self.cv2
+        height, width = image.shape[:2]
+        longest = max(height, width)
+
+        for side in (QR_DECODE_MAX_SIDE, QR_DECODE_MAX_SIDE * 2):
+            if side >= longest:
+                break
+            start = time.perf_counter()
+            scale = side / longest
+            level = small if side == QR_DECODE_MAX_SIDE else cv2.resize(
+                image, (int(width * scale), int(height * scale)), interpolation=cv2.INTER_AREA
+            )
+            region = self._bounding_box(level, scale, width, height)
+            timings.append((f"locate@{side}", (time.perf_counter() - start) * 1000, region is not None))
+            if region is not None:
+                return region
+        return None
+
+    def _bounding_box(self, level, scale, width, height):
+        try:
+            found, points = self._locator._detector().detect(level)
+        except Exception:
+            return None
+        if not found or points is None:
+            return None
+
+        return self._region(points.reshape(-1, 2) / scale, width, height)
+
+    @staticmethod
+    def _region(corners, width, height):
+        """Bounding box of full-resolution corners, padded 15% and clipped, or None if tiny"""
+        x0, y0 = corners.min(axis=0)
+        x1, y1 = corners.max(axis=0)
+        pad = max(x1 - x0, y1 - y0) * 0.15
+        region = (max(0, int(x0 - pad)), max(0, int(y0 - pad)),
+                  min(width, int(x1 + pad)), min(height, int(y1 + pad)))
+        if region[2] - region[0] < 8 or region[3] - region[1] < 8:
+            return None
+        return region
@@ -0,0 +1,99 @@
+# core/qr_raster.py
+"""Vectorized QR rasterizer: module matrix to image in one shot"""
+from PIL import Image
+
+try:
+    import numpy as np
+except ImportError:  # numpy ships with opencv-python, but stay usable without it
+    np = None
+
+
+# Byte translation table used to turn module flags into grayscale pixels
+_MODULE_TO_GRAY = bytes([255, 0]) + bytes(254)
+
+
+def has_numpy():
+    """Check whether the NumPy fast path is available"""
+    return np is not None
+
+
+def rasterize_array(matrix, box_size):
+    """Expand a QRMatrix into a uint8 grayscale array (0 = dark, 255 = light)
+
+    Each module becomes a box_size x box_size block via two np.repeat calls,
+    which is the same result as np.kron with a ones block but without the
+    multiply.
+    """
+    modules = np.frombuffer(matrix.modules, dtype=np.uint8).reshape(matrix.width, matrix.width)
+    gray = np.where(modules, np.uint8(0), np.uint8(255))
+    if box_size > 1:
+        gray = gray.repeat(box_size, axis=0).repeat(box_size, axis=1)
+    return gray
+
+
+def rasterize(matrix, box_size, mode="RGB", size=None):
+    """Render a QRMatrix to a PIL image
+
+    Args:
+        matrix: QRMatrix (border included)
+        box_size: Pixels per module
+        mode: "RGB", "L" or "1" (1-bit, smallest for print output)
+        size: Optional canvas size; the code is centered on white, or
+            scaled down nearest-neighbour if it does not fit
+
+    Returns:
+        PIL Image
+    """
+    if np is not None:
+        img = Image.fromarray(rasterize_array(matrix, box_size), "L")
+    else:
+        img = Image.frombytes("L", (matrix.width, matrix.width), matrix.modules.translate(_MODULE_TO_GRAY))
+        if box_size > 1:
+            img = img.resize((img.width * box_size, img.height * box_size), Image.NEAREST)
+
+    if size is not None and img.width != size:
+        img = _fit(img, size)
+
+    if mode == "L":
+        return img
+    if mode == "1":
+        return img.convert("1", dither=Image.NONE)  # pixels are already pure black/white
+    return img.convert(mode)
+
+
+def to_qimage(matrix, box_size, size=None):
+    """Render a QRMatrix straight to a grayscale QImage, skipping PIL
+
+    For codes without a logo. The pixel buffer is kept alive on the QImage
+    as _pixel_data.
+    """
+    from PyQt5.QtGui import QImage
+
+    gray = None
+    if np is not None:
+        gray = rasterize_array(matrix, box_size)
+        if size is not None and gray.shape[0] != size:
+            pad = size - gray.shape[0]
+            # Shrinking needs resampling: leave that to the PIL path
+            gray = np.pad(gray, ((pad // 2, pad - pad // 2),) * 2, constant_values=255) if pad > 0 else None
+
+    if gray is not None:
+        width, pixels = gray.shape[1], np.ascontiguousarray(gray).tobytes()
+    else:
+        img = rasterize(matrix, box_size, mode="L", size=size)
+        width, pixels = img.width, img.tobytes()
+
+    qimage = QImage(pixels, width, width, width, QImage.Format_Grayscale8)
+    qimage._pixel_data = pixels
+    return qimage
+
+
+def _fit(img, size):
+    """Center img on a white size x size canvas, or shrink it to fit"""
+    if img.width > size:
+        return img.resize((size, size), Image.NEAREST)
+
+    canvas = Image.new("L", (size, size), 255)
+    offset = (size - img.width) // 2
+    canvas.paste(img, (offset, offset))
+    return canvas
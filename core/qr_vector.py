@@ -0,0 +1,233 @@
+# core/qr_vector.py
+"""Vector QR output: SVG path data and PDF drawn straight from the module matrix"""
+import base64
+import zlib
+from io import BytesIO
+
+from core.credential_exporter import open_private
+
+
+def module_runs(matrix):
+    """Yield (x, y, length) for each horizontal run of dark modules"""
+    width, modules = matrix.width, matrix.modules
+    for y in range(width):
+        row = modules[y * width:(y + 1) * width]
+        x = row.find(1)
+        while x != -1:
+            end = row.find(0, x)
+            if end == -1:
+                end = width
+            yield x, y, end - x
+            x = row.find(1, end)
+
+
+def module_rects(matrix):
+    """Yield (x, y, width, height) rectangles covering the dark modules
+
+    A run repeated at the same x and length in consecutive rows extends
+    the rectangle above it. Rectangles come in (y, x) order of their top
+    left corner.
+    """
+    rects = []
+    above = {}  # (x, length) -> rect index, for runs of the previous row
+    row, current = None, {}
+    for x, y, length in module_runs(matrix):
+        if y != row:
+            above = current if row is not None and y == row + 1 else {}
+            row, current = y, {}
+        index = above.get((x, length))
+        if index is None:
+            index = len(rects)
+            rects.append([x, y, length, 1])
+        else:
+            rects[index][3] += 1
+        current[(x, length)] = index
+    return rects
+
+
+def svg_path_data(matrix):
+    """SVG path data in module units, to be stroked 1 module wide
+
+    Each run is a horizontal line through the middle of its row, reached
+    by a relative move from where the previous line ended, so most runs
+    cost a few characters. Butt caps (the SVG default) end the stroke
+    exactly at the run's edges.
+    """
+    parts = []
+    last_x, last_y = 0, 0.0
+    for x, y, length in module_runs(matrix):
+        parts.append(f"m{x - last_x} {y + 0.5 - last_y:g}h{length}")
+        last_x, last_y = x + length, y + 0.5
+    return "".join(parts)
+
+
+def _png_data_uri(logo):
+    buffer = BytesIO()
+    logo.save(buffer, "PNG", optimize=True)
+    return "data:image/png;base64," + base64.b64encode(buffer.getvalue()).decode("ascii")
+
+
+def _escape_xml(text):
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def svg_document(codes, width, height, logo=None, logo_ratio=0.25, label_size=10):
+    """Build an SVG document holding one or more QR codes
+
+    Args:
+        codes: Iterable of (matrix, x, y, size, label) with label possibly None
+        width, height: Document size in user units
+        logo: Optional RGBA PIL image, embedded once and placed with <use>
+            (all codes are expected to share one size)
+        logo_ratio: Logo edge as a fraction of the code size
+        label_size: Font size of labels drawn under codes
+
+    Returns:
+        SVG markup as a string
+    """
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" '
+        f'width="{width}" height="{height}" viewBox="0 0 {width} {height}">\n',
+        '<rect width="100%" height="100%" fill="white"/>\n',
+    ]
+    logo_size = None
+
+    for matrix, x, y, size, label in codes:
+        scale = size / matrix.width
+        parts.append(f'<path transform="translate({x} {y}) scale({scale:.6g})" shape-rendering="crispEdges" '
+                     f'fill="none" stroke="black" d="{svg_path_data(matrix)}"/>\n')
+        if logo is not None:
+            if logo_size is None:
+                # Codes on one document share a size, so the logo is defined once at that size
+                logo_size = size * logo_ratio
+                parts.append(f'<defs><image id="logo" width="{logo_size:.6g}" height="{logo_size:.6g}" '
+                             f'xlink:href="{_png_data_uri(logo)}"/></defs>\n')
+            offset = (size - logo_size) / 2
+            parts.append(f'<use xlink:href="#logo" x="{x + offset:.6g}" y="{y + offset:.6g}"/>\n')
+        if label:
+            parts.append(f'<text x="{x}" y="{y + size + label_size}" font-size="{label_size}" '
+                         f'font-family="sans-serif">{_escape_xml(label)}</text>\n')
+
+    parts.append("</svg>\n")
+    return "".join(parts)
+
+
+class PdfWriter:
+    """Minimal streaming PDF writer for pages of vector QR codes
+
+    Pages are written as soon as they are added, so only the object offset
+    table stays in memory. Each code is a single filled path of module runs;
+    the logo is stored once as an image XObject (with an alpha soft mask)
+    and referenced from every page.
+
+    Coordinates passed in are top-left based points, like the raster sheets.
+    """
+
+    _CATALOG, _PAGES, _FONT, _LOGO, _LOGO_MASK = 1, 2, 3, 4, 5
+
+    def __init__(self, path, page_width, page_height, logo=None, logo_ratio=0.25):
+        """Open path (readable by the owner only) and write the shared objects
+
+        Args:
+            path: Output file path
+            page_width, page_height: Page size in points
+            logo: Optional RGBA PIL image
+            logo_ratio: Logo edge as a fraction of the code size
+        """
+        self.page_width = page_width
+        self.page_height = page_height
+        self.logo_ratio = logo_ratio
+        self.has_logo = logo is not None
+        self._offsets = {}
+        self._page_ids = []
+        self._next_id = 6
+        self._file = open_private(path, "wb")
+        self._file.write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+
+        self._write_object(self._FONT, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+        if logo is not None:
+            self._write_logo(logo)
+
+    def add_page(self, codes, label_size=8):
+        """Write one page
+
+        Args:
+            codes: Iterable of (matrix, x, y, size, label) in points
+            label_size: Font size of labels drawn under codes
+        """
+        ops = []
+        for matrix, x, y, size, label in codes:
+            scale = size / matrix.width
+            # Module space: origin at the code's top-left corner, y pointing down
+            ops.append(f"q {scale:.6g} 0 0 {-scale:.6g} {x:.6g} {self.page_height - y:.6g} cm")
+            ops.extend(f"{mx} {my} {mw} {mh} re" for mx, my, mw, mh in module_rects(matrix))
+            ops.append("f Q")
+            if self.has_logo:
+                logo_size = size * self.logo_ratio
+                offset = (size - logo_size) / 2
+                ops.append(f"q {logo_size:.6g} 0 0 {logo_size:.6g} {x + offset:.6g} "
+                           f"{self.page_height - y - offset - logo_size:.6g} cm /Logo Do Q")
+            if label:
+                text = label.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+                ops.append(f"BT /F1 {label_size} Tf {x:.6g} {self.page_height - y - size - label_size:.6g} Td "
+                           f"({text}) Tj ET")
+
+        content = zlib.compress("\n".join(ops).encode("latin-1", "replace"))
+        content_id, page_id = self._allocate(), self._allocate()
+        self._write_stream(content_id, b"/Filter /FlateDecode", content)
+
+        resources = f"/Font << /F1 {self._FONT} 0 R >>"
+        if self.has_logo:
+            resources += f" /XObject << /Logo {self._LOGO} 0 R >>"
+        self._write_object(page_id, (
+            f"<< /Type /Page /Parent {self._PAGES} 0 R /MediaBox [0 0 {self.page_width:.6g} {self.page_height:.6g}] "
+            f"/Resources << {resources} >> /Contents {content_id} 0 R >>"
+        ).encode("ascii"))
+        self._page_ids.append(page_id)
+
+    def close(self):
+        """Write the page tree, catalog and cross-reference table"""
+        if self._file is None:
+            return
+
+        kids = " ".join(f"{page_id} 0 R" for page_id in self._page_ids)
+        self._write_object(self._PAGES, f"<< /Type /Pages /Kids [{kids}] /Count {len(self._page_ids)} >>".encode("ascii"))
+        self._write_object(self._CATALOG, f"<< /Type /Catalog /Pages {self._PAGES} 0 R >>".encode("ascii"))
+
+        xref_offset = self._file.tell()
+        size = self._next_id
+        lines = [f"xref\n0 {size}\n", "0000000000 65535 f \n"]
+        for object_id in range(1, size):
+            offset = self._offsets.get(object_id)
+            lines.append(f"{offset:010d} 00000 n \n" if offset is not None else "0000000000 65535 f \n")
+        lines.append(f"trailer\n<< /Size {size} /Root {self._CATALOG} 0 R >>\nstartxref\n{xref_offset}\n%%EOF\n")
+        self._file.write("".join(lines).encode("ascii"))
+        self._file.close()
+        self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _allocate(self):
+        object_id = self._next_id
+        self._next_id += 1
+        return object_id
+
+    def _write_object(self, object_id, body):
+        self._offsets[object_id] = self._file.tell()
+        self._file.write(f"{object_id} 0 obj\n".encode("ascii") + body + b"\nendobj\n")
+
+    def _write_stream(self, object_id, dictionary, data):
+        self._write_object(object_id, b"<< " + dictionary + f" /Length {len(data)} >>\nstream\n".encode("ascii")
+                           + data + b"\nendstream")
+
+    def _write_logo(self, logo):
+        width, height = logo.size
+        rgb = zlib.compress(logo.convert("RGB").tobytes())
+        alpha = zlib.compress(logo.getchannel("A").tobytes())
+        image = f"/Type /XObject /Subtype /Image /Width {width} /Height {height} /BitsPerComponent 8 /Filter /FlateDecode"
+        self._write_stream(self._LOGO_MASK, f"{image} /ColorSpace /DeviceGray".encode("ascii"), alpha)
+        self._write_stream(self._LOGO, f"{image} /ColorSpace /DeviceRGB /SMask {self._LOGO_MASK} 0 R".encode("ascii"), rgb)
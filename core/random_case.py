@@ -0,0 +1,44 @@
+# core/random_case.py
+"""Random letter case from bit masks: one random byte per 8 characters"""
+
+_FLIP = 0x20  # ASCII lowercase letter XOR 0x20 -> its uppercase
+
+# Random byte -> 8 mask bytes, 0x20 where the corresponding bit is set
+_SPREAD = tuple(bytes(_FLIP if value >> bit & 1 else 0 for bit in range(8)) for value in range(256))
+
+# ASCII lowercase letters -> 0x20 (may flip), everything else -> 0 (never changes)
+_LETTERS = bytes(_FLIP if 0x61 <= b <= 0x7A else 0 for b in range(256))
+
+
+def random_case(words, read):
+    """Upper-case each character whose random bit is set, lower-case the rest
+
+    Same result distribution as a fair coin flip per character, but one
+    random byte covers 8 characters and all words are cased in a single
+    pass. For ASCII text the flips are applied as one big-integer XOR of
+    the lower-cased bytes with the random mask (limited to letters);
+    other text falls back to a per-character loop over the same mask.
+
+    Args:
+        words: List of words (without newlines, as in any wordlist)
+        read: Callable(n) returning n random bytes, e.g. secrets.token_bytes
+            or RandomBytePool.read
+
+    Returns:
+        List of cased words
+    """
+    if not words:
+        return []
+
+    text = "\n".join(words).lower()
+    size = len(text)
+    mask = b"".join(map(_SPREAD.__getitem__, read((size + 7) // 8)))[:size]
+
+    if text.isascii():
+        data = text.encode("ascii")
+        flips = int.from_bytes(mask, "big") & int.from_bytes(data.translate(_LETTERS), "big")
+        text = (int.from_bytes(data, "big") ^ flips).to_bytes(size, "big").decode("ascii")
+    else:
+        text = "".join(c.upper() if m else c for c, m in zip(text, mask))
+
+    return text.split("\n")
@@ -0,0 +1,136 @@
+# core/random_pool.py
+"""Batched CSPRNG byte pool for bulk generation"""
+import os
+import secrets
+import threading
+import weakref
+from array import array
+
+from app_config.app_config import RANDOM_POOL_SIZE
+
+# Every live pool, so forked children can drop the bytes they inherited
+_pools = weakref.WeakSet()
+
+
+def _reset_pools_after_fork():
+    for pool in list(_pools):
+        pool._reset()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pools_after_fork)
+
+
+class RandomBytePool:
+    """Serves os.urandom bytes from a large pre-fetched buffer
+
+    Bulk generators draw thousands of random values at once; fetching them
+    from one big buffer replaces a CSPRNG call per value with one per pool.
+
+    A fork()ed child inherits a copy of the buffer, so children discard it
+    and refill from os.urandom; parent and children never share bytes.
+    """
+
+    # Unsigned array typecodes by item size, used to split raw bytes into ints
+    _TYPECODES = {1: "B", 2: "H", 4: "I"}
+
+    def __init__(self, pool_size=None):
+        self.pool_size = pool_size or RANDOM_POOL_SIZE
+        self._reset()
+        _pools.add(self)
+
+    def _reset(self):
+        """Drop buffered bytes (the lock is recreated: a forked child may
+        inherit it held by a parent thread that no longer exists)"""
+        self._buffer = b""
+        self._offset = 0
+        self._lock = threading.Lock()
+
+    def read(self, n):
+        """Read n random bytes
+
+        Args:
+            n: Number of bytes
+
+        Returns:
+            bytes of length n
+        """
+        with self._lock:
+            available = len(self._buffer) - self._offset
+            if n > available:
+                # Keep the unread tail and top up in one urandom call
+                tail = self._buffer[self._offset:]
+                self._buffer = tail + os.urandom(max(self.pool_size, n - available))
+                self._offset = 0
+
+            chunk = self._buffer[self._offset:self._offset + n]
+            self._offset += n
+            return chunk
+
+    def randbelow_many(self, upper, count):
+        """Draw count uniform integers in [0, upper) with rejection sampling
+
+        Args:
+            upper: Exclusive upper bound (must be > 0)
+            count: Number of values
+
+        Returns:
+            List of ints
+        """
+        if upper <= 0:
+            raise ValueError("Upper bound must be positive")
+        if upper == 1:
+            return [0] * count
+
+        width = (upper - 1).bit_length()
+        itemsize = 1 if width <= 8 else 2 if width <= 16 else 4 if width <= 32 else None
+        if itemsize is None:
+            return [secrets.randbelow(upper) for _ in range(count)]
+
+        typecode = self._TYPECODES[itemsize]
+        if array(typecode).itemsize != itemsize:
+            return [secrets.randbelow(upper) for _ in range(count)]
+
+        span = 1 << (8 * itemsize)
+        limit = span - span % upper  # values >= limit would bias the modulo
+        accept_ratio = limit / span
+
+        values = []
+        while len(values) < count:
+            missing = count - len(values)
+            draw = int(missing / accept_ratio) + 16
+            raw = array(typecode)
+            raw.frombytes(self.read(draw * itemsize))
+            values.extend(v % upper for v in raw if v < limit)
+
+        del values[count:]
+        return values
+
+    def translate_stream(self, charset, count):
+        """Draw count characters uniformly from an ASCII charset
+
+        Maps random bytes straight to characters with bytes.translate and
+        drops biased bytes with the delete table, so sampling runs in C.
+
+        Args:
+            charset: String of at most 256 ASCII characters
+            count: Number of characters
+
+        Returns:
+            String of length count
+        """
+        size = len(charset)
+        limit = 256 - 256 % size
+        table = bytes(ord(charset[b % size]) if b < limit else 0 for b in range(256))
+        rejected = bytes(range(limit, 256))
+        accept_ratio = limit / 256
+
+        out = []
+        produced = 0
+        while produced < count:
+            raw = self.read(int((count - produced) / accept_ratio) + 16)
+            chunk = raw.translate(table, rejected)
+            out.append(chunk)
+            produced += len(chunk)
+
+        return b"".join(out)[:count].decode("ascii")
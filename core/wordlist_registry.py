@@ -0,0 +1,200 @@
+# core/wordlist_registry.py
+"""Process-wide wordlist registry: resolve, load and validate each wordlist once"""
+import hashlib
+import os
+import sys
+import threading
+from collections import namedtuple
+
+from core.compiled_wordlist import COMPILED_WORDLIST_EXT, CompiledWordlist, is_compiled_wordlist, parse_wordlist_lines
+
+# stamp: (mtime_ns, size) of the file when it was loaded; digest: SHA-256 hex
+_Entry = namedtuple("_Entry", "stamp digest words")
+
+
+class WordlistRegistry:
+    """Hands out one shared, immutable copy of each wordlist
+
+    Text wordlists are parsed into a tuple of str; compiled (.cwl) files
+    are memory-mapped as a CompiledWordlist. Either way every caller gets
+    the same read-only object, so any number of PassphraseGenerators
+    share one copy.
+
+    Entries are keyed by resolved path and revalidated with a stat call:
+    a file whose mtime or size changed is loaded again. Files with the
+    same content (same SHA-256) share one copy even under different paths.
+    A text file with a compiled sibling (same name, .cwl, not older) is
+    served from the sibling.
+    """
+
+    # Tried in order after the requested path (relative to cwd, app dir, bundle)
+    FALLBACK_PATHS = (
+        "assets/wordlist/eff_file.wordlist",
+        "wordlist/eff_file.wordlist",
+        "eff_file.wordlist",
+        ":/assets/wordlist/eff_file.wordlist",
+    )
+
+    _entries = {}  # resolved path -> _Entry
+    _by_digest = {}  # digest -> words
+    _lock = threading.Lock()
+
+    @classmethod
+    def get(cls, path=None, fallback=True):
+        """Return the shared words of a wordlist
+
+        Args:
+            path: File path (either slash style), Qt resource path
+                (:/path/to/file), or None for the default list
+            fallback: Try FALLBACK_PATHS when path cannot be found
+
+        Returns:
+            tuple of str, or CompiledWordlist
+
+        Raises:
+            FileNotFoundError: If no candidate path exists
+            ValueError: If the wordlist is empty or not valid UTF-8
+        """
+        resolved = cls.resolve(path, fallback)
+        if resolved is None:
+            raise FileNotFoundError(f"Wordlist file not found: {path or cls.FALLBACK_PATHS[0]}")
+
+        with cls._lock:
+            stamp = cls._stamp(resolved)
+            entry = cls._entries.get(resolved)
+            if entry is not None and entry.stamp == stamp:
+                return entry.words
+
+            digest, words = cls._load(resolved)
+            shared = cls._by_digest.get(digest)
+            if shared is not None and shared is not words:
+                # Same content already mapped or parsed: unmap the new copy
+                if isinstance(words, CompiledWordlist):
+                    words.close()
+                words = shared
+            if not words:
+                raise ValueError(f"Wordlist is empty: {resolved}")
+
+            cls._entries[resolved] = _Entry(stamp, digest, words)
+            cls._by_digest[digest] = words
+            if entry is not None and entry.digest != digest:
+                cls._forget_digest(entry.digest)
+            return words
+
+    @classmethod
+    def resolve(cls, path=None, fallback=True):
+        """Find the file a wordlist path refers to
+
+        Returns:
+            Absolute file path, a Qt resource path, or None
+        """
+        candidates = [path] if path else []
+        if fallback or not path:
+            candidates.extend(cls.FALLBACK_PATHS)
+
+        for candidate in candidates:
+            found = cls._find(candidate)
+            if found:
+                return found
+        return None
+
+    @classmethod
+    def clear(cls):
+        """Drop every cached wordlist (views already handed out stay valid)"""
+        with cls._lock:
+            cls._entries.clear()
+            cls._by_digest.clear()
+
+    # ---------------------------------------------------------
+    # Internals
+    # ---------------------------------------------------------
+    @classmethod
+    def _find(cls, candidate):
+        resource = candidate.startswith(":/")
+        relative = (candidate[2:] if resource else candidate).replace("\\", "/")
+
+        if os.path.isabs(relative):
+            paths = [relative]
+        else:
+            paths = [os.path.join(base, relative) for base in cls._bases()]
+
+        for file_path in paths:
+            if os.path.isfile(file_path):
+                return cls._prefer_compiled(os.path.abspath(file_path))
+
+        if resource and cls._resource_exists(candidate):
+            return candidate
+        return None
+
+    @staticmethod
+    def _bases():
+        """Directories relative paths are tried against (cwd, app dir, PyInstaller bundle)"""
+        app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        bases = []
+        for base in (os.getcwd(), app_dir, getattr(sys, "_MEIPASS", None)):
+            if base and base not in bases:
+                bases.append(base)
+        return bases
+
+    @staticmethod
+    def _prefer_compiled(file_path):
+        stem, ext = os.path.splitext(file_path)
+        if ext == COMPILED_WORDLIST_EXT:
+            return file_path
+        compiled = stem + COMPILED_WORDLIST_EXT
+        try:
+            if os.path.getmtime(compiled) >= os.path.getmtime(file_path):
+                return compiled
+        except OSError:
+            pass
+        return file_path
+
+    @staticmethod
+    def _stamp(resolved):
+        if resolved.startswith(":/"):
+            return (0, 0)  # compiled into the binary, never changes
+        st = os.stat(resolved)
+        return (st.st_mtime_ns, st.st_size)
+
+    @classmethod
+    def _load(cls, resolved):
+        """Return (digest, words) for a resolved path"""
+        if resolved.startswith(":/"):
+            data = cls._read_resource(resolved)
+        elif is_compiled_wordlist(resolved):
+            words = CompiledWordlist(resolved)
+            return words.digest, words
+        else:
+            with open(resolved, "rb") as f:
+                data = f.read()
+
+        try:
+            text = data.decode("utf-8-sig")
+        except UnicodeDecodeError as e:
+            raise ValueError(f"Wordlist is not valid UTF-8: {resolved} ({e})") from None
+        return hashlib.sha256(data).hexdigest(), tuple(parse_wordlist_lines(text.splitlines()))
+
+    @staticmethod
+    def _resource_exists(resource_path):
+        try:
+            from PyQt5.QtCore import QFile
+        except ImportError:
+            return False
+        return QFile.exists(resource_path)
+
+    @staticmethod
+    def _read_resource(resource_path):
+        from PyQt5.QtCore import QFile, QIODevice
+
+        qfile = QFile(resource_path)
+        if not qfile.open(QIODevice.ReadOnly):
+            raise FileNotFoundError(f"Wordlist resource not found: {resource_path}")
+        try:
+            return bytes(qfile.readAll())
+        finally:
+            qfile.close()
+
+    @classmethod
+    def _forget_digest(cls, digest):
+        if not any(entry.digest == digest for entry in cls._entries.values()):
+            cls._by_digest.pop(digest, None)
@@ -0,0 +1 @@
+"""Headless command-line interface for Cryptext Gen Pro (python -m cryptext)"""
@@ -0,0 +1,6 @@
+"""Entry point for python -m cryptext"""
+import sys
+
+from cryptext.cli import main
+
+sys.exit(main())
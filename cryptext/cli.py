@@ -0,0 +1,314 @@
+# cryptext/cli.py
+"""Command-line interface: generate, analyze and QR encode/decode without the GUI
+
+Only argparse and the standard library are imported up front. Each
+subcommand imports the core modules it needs, so generating a password never
+loads PyQt5, OpenCV or the Qt resource bundle.
+"""
+import argparse
+import json
+import os
+import sys
+from contextlib import redirect_stdout
+
+
+def _load_config():
+    """Import app_config with its startup messages sent to stderr
+
+    Keeps stdout clean for piping generated credentials.
+    """
+    with redirect_stdout(sys.stderr):
+        import app_config.app_config as config
+    return config
+
+
+def _emit(credentials, args, kind):
+    """Write credentials to --output through the exporter, or to stdout"""
+    if args.output:
+        from core.credential_exporter import CredentialExporter
+
+        count = CredentialExporter(fsync_every=args.fsync_every).export(
+            credentials, args.output, fmt=args.format, kind=kind
+        )
+        print(f"Wrote {count} {kind}s to {args.output}", file=sys.stderr)
+        return
+
+    write = sys.stdout.write
+    for credential in credentials:
+        write(credential)
+        write("\n")
+
+
+def cmd_password(args):
+    config = _load_config()
+    from core.password_generator import PasswordGenerator
+
+    generator = PasswordGenerator()
+    options = (not args.no_upper, not args.no_lower, not args.no_numbers, not args.no_symbols)
+    length = args.length or config.DEFAULT_PASSWORD_LENGTH
+
+    if args.advanced:
+        if length > generator.max_advanced_length(*options):
+            # Raise the option error now, before --output is opened
+            generator.generate_advanced(length, *options)
+        credentials = (generator.generate_advanced(length, *options) for _ in range(args.count))
+    else:
+        credentials = generator.generate_many(args.count, length, *options)
+
+    _emit(credentials, args, "password")
+    return 0
+
+
+def cmd_passphrase(args):
+    config = _load_config()
+    from core.passphrase_generator import PassphraseGenerator
+    from core.wordlist_registry import WordlistRegistry
+
+    separator = config.DEFAULT_SEPARATOR if args.separator is None else args.separator
+    if args.template or args.target_bits or args.list:
+        credentials = _composed_passphrases(args, config, separator)
+        _emit(credentials, args, "passphrase")
+        return 0
+
+    # WORDLIST_PATH is None when app_config's cwd-relative lookup fails; the
+    # registry then finds the bundled list next to the app, from any cwd.
+    # An explicit --wordlist must exist.
+    wordlist = WordlistRegistry.get(args.wordlist or config.WORDLIST_PATH, fallback=not args.wordlist)
+
+    generator = PassphraseGenerator(wordlist)
+    num_words = args.words or config.DEFAULT_WORDS
+
+    credentials = generator.generate_many(args.count, num_words, separator, args.case)
+    _emit(credentials, args, "passphrase")
+    return 0
+
+
+def _composed_passphrases(args, config, separator):
+    """Passphrases from --template / --target-bits over the --list wordlists"""
+    from core.passphrase_composer import PassphraseComposer
+
+    if args.words:
+        raise ValueError("--words cannot be combined with --template or --target-bits")
+
+    # "eff" is the default wordlist (or --wordlist) unless redefined by --list
+    wordlists = {"eff": args.wordlist or config.WORDLIST_PATH}
+    for spec in args.list or ():
+        name, sep, path = spec.partition("=")
+        if not sep or not name or not path:
+            raise ValueError(f"--list expects NAME=PATH, got '{spec}'")
+        wordlists[name] = path
+
+    composer = PassphraseComposer(wordlists)
+    template = args.template
+    if not template:
+        # Without a target, match the entropy of the default passphrase length
+        target = args.target_bits or config.DEFAULT_WORDS * composer.entropy("eff").min_entropy
+        template = composer.plan(target)
+
+    entropy = composer.entropy(template)
+    if args.target_bits and entropy.min_entropy < args.target_bits:
+        raise ValueError(f"Template gives {entropy.min_entropy:.1f} bits, below --target-bits {args.target_bits}")
+    template_text = template if isinstance(template, str) else " ".join(template)
+    print(f"Template '{template_text}': {entropy.min_entropy:.1f} bits min-entropy "
+          f"({entropy.shannon:.1f} bits Shannon)", file=sys.stderr)
+
+    return composer.generate_many(args.count, template, separator, args.case)
+
+
+def cmd_analyze(args):
+    from core.strength_analyzer import StrengthAnalyzer
+
+    password = sys.stdin.readline().rstrip("\r\n") if args.password == "-" else args.password
+    metrics = StrengthAnalyzer().analyze(password)
+
+    if args.json:
+        print(json.dumps(metrics))
+    else:
+        print(f"Strength: {metrics['strength']}")
+        print(f"Entropy: {metrics['entropy']:.1f} bits")
+        print(f"Crack time: {metrics['crack_time']}")
+    return 0
+
+
+def cmd_qr_encode(args):
+    _load_config()
+    from core.qr_handler import QRHandler
+
+    data = sys.stdin.read().rstrip("\r\n") if args.data == "-" else args.data
+    if not data.strip():
+        raise ValueError("Nothing to encode")
+
+    handler = QRHandler()
+    ext = os.path.splitext(args.output)[1].lower()
+    if ext == ".svg":
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(handler.generate_svg(data, args.logo))
+    elif ext == ".pdf":
+        handler.save_pdf(data, args.output, args.logo)
+    else:
+        handler.generate(data, args.logo).save(args.output)
+    print(f"QR code saved to {args.output}", file=sys.stderr)
+    return 0
+
+
+def cmd_qr_decode(args):
+    _load_config()
+    from core.qr_handler import QRHandler
+
+    handler = QRHandler()
+    if args.all:
+        detections = handler.scan_all_from_file(args.image)
+        for detection in detections:
+            print(json.dumps(detection._asdict(), ensure_ascii=False))
+        if not detections:
+            print("No QR code found or unreadable QR code.", file=sys.stderr)
+            return 1
+        return 0
+
+    data = handler.scan_from_file(args.image)
+    if not data:
+        print("No QR code found or unreadable QR code.", file=sys.stderr)
+        return 1
+
+    print(data)
+    return 0
+
+
+def cmd_qr_batch(args):
+    _load_config()
+    from core.qr_batch_export import QRBatchExporter, read_credentials
+
+    exporter = QRBatchExporter(workers=args.workers, logo_path=args.logo)
+    if args.columns:
+        exporter.columns = args.columns
+    if args.rows:
+        exporter.rows = args.rows
+
+    def progress(done):
+        print(f"\rEncoded {done} QR codes", end="", file=sys.stderr)
+
+    written = exporter.export(read_credentials(args.input), args.output, fmt=args.format, progress=progress)
+    print(f"\nWrote {len(written)} file(s): {', '.join(written)}", file=sys.stderr)
+    return 0
+
+
+def cmd_qr_import(args):
+    _load_config()
+    import threading
+    from core.credential_exporter import open_private
+    from core.qr_bulk_import import QRBulkImporter, write_jsonl
+
+    cancel = threading.Event()
+    results = QRBulkImporter(workers=args.workers, multi=args.all).run(args.source, cancel)
+    # Decoded payloads are plaintext secrets: owner-only, like exports
+    out = open_private(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+
+    try:
+        decoded, failed = write_jsonl(results, out)
+    except KeyboardInterrupt:
+        cancel.set()
+        results.close()
+        print("Import cancelled", file=sys.stderr)
+        return 130
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    print(f"{decoded} decoded, {failed} failed", file=sys.stderr)
+    return 0 if not failed else 2
+
+
+def _add_output_options(parser):
+    parser.add_argument("-n", "--count", type=int, default=1, help="number of credentials (default: 1)")
+    parser.add_argument("-o", "--output", help="stream to a file instead of stdout")
+    parser.add_argument("--format", choices=("csv", "jsonl", "keepass"),
+                        help="output file format (default: from extension)")
+    parser.add_argument("--fsync-every", type=int, default=None, metavar="N",
+                        help="fsync the output file every N records")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="cryptext",
+        description="Cryptext Gen Pro - headless password and passphrase tools",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    password = commands.add_parser("password", help="generate passwords")
+    password.add_argument("-l", "--length", type=int, help="password length (default: 20)")
+    password.add_argument("--advanced", action="store_true",
+                          help="no repeated characters and no consecutive character types")
+    password.add_argument("--no-upper", action="store_true", help="exclude uppercase letters")
+    password.add_argument("--no-lower", action="store_true", help="exclude lowercase letters")
+    password.add_argument("--no-numbers", action="store_true", help="exclude numbers")
+    password.add_argument("--no-symbols", action="store_true", help="exclude special symbols")
+    _add_output_options(password)
+    password.set_defaults(func=cmd_password)
+
+    passphrase = commands.add_parser("passphrase", help="generate passphrases")
+    passphrase.add_argument("-w", "--words", type=int, help="number of words (default: 4)")
+    passphrase.add_argument("-s", "--separator", help="word separator (default: -)")
+    passphrase.add_argument("-c", "--case", default="lowercase",
+                            choices=("lowercase", "uppercase", "title case", "random case"))
+    passphrase.add_argument("--wordlist", help="path to a wordlist file (text or compiled .cwl)")
+    passphrase.add_argument("--list", action="append", metavar="NAME=PATH",
+                            help="named wordlist for --template (repeatable; 'eff' is the default list)")
+    passphrase.add_argument("--template",
+                            help="word slots by list name, e.g. 'eff short:3|de:1 eff' (weights optional)")
+    passphrase.add_argument("--target-bits", type=float,
+                            help="pick the shortest template over the --list wordlists reaching this entropy")
+    _add_output_options(passphrase)
+    passphrase.set_defaults(func=cmd_passphrase)
+
+    analyze = commands.add_parser("analyze", help="estimate password strength")
+    analyze.add_argument("password", help="password to analyze, or - to read one line from stdin")
+    analyze.add_argument("--json", action="store_true", help="print metrics as JSON")
+    analyze.set_defaults(func=cmd_analyze)
+
+    qr = commands.add_parser("qr", help="QR code encode/decode")
+    qr_commands = qr.add_subparsers(dest="qr_command", required=True)
+
+    encode = qr_commands.add_parser("encode", help="write text to a QR code image")
+    encode.add_argument("data", help="text to encode, or - to read stdin")
+    encode.add_argument("-o", "--output", required=True,
+                        help="output path; .svg and .pdf are written as vectors")
+    encode.add_argument("--logo", help="logo image to embed in the center")
+    encode.set_defaults(func=cmd_qr_encode)
+
+    decode = qr_commands.add_parser("decode", help="read a QR code from an image file")
+    decode.add_argument("image", help="image file path")
+    decode.add_argument("--all", action="store_true",
+                        help="decode every code in the image; prints JSON lines with corner points")
+    decode.set_defaults(func=cmd_qr_decode)
+
+    batch = qr_commands.add_parser("batch", help="render many credentials onto QR sheets")
+    batch.add_argument("input", help="text file with one credential per line, or - for stdin")
+    batch.add_argument("-o", "--output", required=True,
+                       help="output path (.pdf, or .png/.svg written as one file per sheet)")
+    batch.add_argument("--format", choices=("png", "svg", "pdf"), help="sheet format (default: from extension)")
+    batch.add_argument("--workers", type=int, help="encoder processes (default: CPU count)")
+    batch.add_argument("--columns", type=int, help="codes per row")
+    batch.add_argument("--rows", type=int, help="rows per sheet")
+    batch.add_argument("--logo", help="logo image to embed in every code")
+    batch.set_defaults(func=cmd_qr_batch)
+
+    bulk = qr_commands.add_parser("import", help="decode every QR image in a directory or archive")
+    bulk.add_argument("source", help="directory, .zip or .tar archive of images")
+    bulk.add_argument("-o", "--output", help="write JSON lines to a file instead of stdout")
+    bulk.add_argument("--workers", type=int, help="decoder processes (default: CPU count)")
+    bulk.add_argument("--all", action="store_true", help="report every code in each image, with corner points")
+    bulk.set_defaults(func=cmd_qr_import)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except (ValueError, OSError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    except ImportError as e:
+        print(f"Error: missing dependency for '{args.command}': {e}", file=sys.stderr)
+        return 1
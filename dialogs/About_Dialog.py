@@ -27,7 +27,9 @@ from app_config.app_config import (
     ABOUT_ICON_PATH, DARK_THEME_QSS, LIGHT_THEME_QSS
 )
 from utils.icon_manager import load_icon
-import resources_rc
+from utils.resource_loader import ResourceLoader
+
+ResourceLoader.ensure_loaded()
 
 
 class AboutDialog(QDialog):
@@ -0,0 +1,233 @@
+# dialog/bulk_import_dialog.py
+# ---------------------------------------------------------
+# 📂 Bulk QR Import Dialog - Cryptext Gen Pro
+# ---------------------------------------------------------
+# Decodes every QR image in a folder or archive on a
+# process pool and lists the results as they arrive.
+# Sheets with many codes can be read per image or from
+# the camera. Results can be exported as JSON lines.
+# ---------------------------------------------------------
+import threading
+import time
+
+from PyQt5.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QCheckBox,
+    QTableWidget, QTableWidgetItem, QHeaderView, QFileDialog, QMessageBox
+)
+from PyQt5.QtGui import QIcon
+from PyQt5.QtCore import QThread, pyqtSignal
+from app_config.app_config import APP_NAME, ICON_PATH
+from core.credential_exporter import open_private
+from core.qr_bulk_import import ImportResult, QRBulkImporter, write_jsonl
+from dialogs.Camera_Scan_Dialog import CameraScanDialog
+
+
+class _ImportThread(QThread):
+    """Runs QRBulkImporter off the GUI thread"""
+
+    result_ready = pyqtSignal(object)  # ImportResult
+    failed = pyqtSignal(str)
+
+    def __init__(self, source, multi=False):
+        super().__init__()
+        self.source = source
+        self.multi = multi
+        self.cancel_event = threading.Event()
+
+    def run(self):
+        try:
+            for result in QRBulkImporter(multi=self.multi).run(self.source, self.cancel_event):
+                self.result_ready.emit(result)
+        except Exception as e:
+            self.failed.emit(str(e))
+
+
+class BulkImportDialog(QDialog):
+    """Bulk QR import with a live results table."""
+
+    COLUMNS = ("File", "Payload", "Backend", "Time (ms)", "Status")
+
+    def __init__(self, qr_handler, parent=None):
+        super().__init__(parent)
+        self.qr_handler = qr_handler
+        self.setWindowTitle(f"{APP_NAME} - Bulk QR Import")
+        self.setWindowIcon(QIcon(ICON_PATH))
+        self.setMinimumSize(820, 520)
+        self.setModal(True)
+
+        self.results = []
+        self.thread = None
+        self.setup_ui()
+
+    # ---------------------------------------------------------
+    # 🧱 UI Structure
+    # ---------------------------------------------------------
+    def setup_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(16, 16, 16, 16)
+        layout.setSpacing(10)
+
+        source_layout = QHBoxLayout()
+        self.folder_btn = QPushButton("📁 Choose Folder")
+        self.folder_btn.clicked.connect(self.on_choose_folder)
+        self.archive_btn = QPushButton("🗜 Choose Archive")
+        self.archive_btn.clicked.connect(self.on_choose_archive)
+        self.camera_btn = QPushButton("📷 Scan Sheet")
+        self.camera_btn.clicked.connect(self.on_scan_sheet)
+        self.multi_check = QCheckBox("Every code per image")
+        self.multi_check.setToolTip("Read all QR codes in each image, e.g. photographed credential sheets")
+        self.show_payloads = QCheckBox("Show payloads")
+        self.show_payloads.toggled.connect(self.refresh_payloads)
+        source_layout.addWidget(self.folder_btn)
+        source_layout.addWidget(self.archive_btn)
+        source_layout.addWidget(self.camera_btn)
+        source_layout.addStretch()
+        source_layout.addWidget(self.multi_check)
+        source_layout.addWidget(self.show_payloads)
+        layout.addLayout(source_layout)
+
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+        layout.addWidget(self.table)
+
+        self.status_label = QLabel("Choose a folder or a .zip/.tar archive of QR images.")
+        layout.addWidget(self.status_label)
+
+        btn_layout = QHBoxLayout()
+        btn_layout.addStretch()
+        self.export_btn = QPushButton("💾 Export JSONL")
+        self.export_btn.setEnabled(False)
+        self.export_btn.clicked.connect(self.on_export)
+        self.cancel_btn = QPushButton("Cancel")
+        self.cancel_btn.setEnabled(False)
+        self.cancel_btn.clicked.connect(self.on_cancel)
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(self.reject)
+        btn_layout.addWidget(self.export_btn)
+        btn_layout.addWidget(self.cancel_btn)
+        btn_layout.addWidget(close_btn)
+        layout.addLayout(btn_layout)
+
+    # ---------------------------------------------------------
+    # 📂 Import
+    # ---------------------------------------------------------
+    def on_choose_folder(self):
+        folder = QFileDialog.getExistingDirectory(self, "Select Folder of QR Images")
+        if folder:
+            self.start_import(folder)
+
+    def on_choose_archive(self):
+        filename, _ = QFileDialog.getOpenFileName(
+            self, "Select Archive of QR Images", "", "Archives (*.zip *.tar *.tar.gz *.tgz *.tar.bz2 *.tar.xz)"
+        )
+        if filename:
+            self.start_import(filename)
+
+    def start_import(self, source):
+        """Clear the table and decode everything under source"""
+        if self.thread is not None and self.thread.isRunning():
+            return
+
+        self.results = []
+        self.table.setRowCount(0)
+        self.status_label.setText(f"Decoding {source} ...")
+        self.set_running(True)
+
+        self.thread = _ImportThread(source, self.multi_check.isChecked())
+        self.thread.result_ready.connect(self.on_result)
+        self.thread.failed.connect(self.on_failed)
+        self.thread.finished.connect(self.on_finished)
+        self.thread.start()
+
+    def on_scan_sheet(self):
+        """Add every code read from the camera (multi-code scan) to the table"""
+        if self.thread is not None and self.thread.isRunning():
+            return
+
+        start = time.perf_counter()
+        dialog = CameraScanDialog(self.qr_handler, multi=True, parent=self)
+        dialog.exec_()
+        if dialog.error:
+            QMessageBox.critical(self, "Error", f"Failed to scan QR codes: {dialog.error}")
+            return
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        for text in dialog.decoded_texts:
+            self.on_result(ImportResult("camera", text, "camera", elapsed_ms, None))
+        self.export_btn.setEnabled(bool(self.results))
+        self.status_label.setText(self._summary("Camera scan:"))
+
+    def on_result(self, result):
+        self.results.append(result)
+        row = self.table.rowCount()
+        self.table.insertRow(row)
+        values = (result.file, self._payload_text(result), result.backend or "",
+                  f"{result.elapsed_ms:.1f}", result.error or "✅ Decoded")
+        for column, value in enumerate(values):
+            self.table.setItem(row, column, QTableWidgetItem(value))
+
+        if len(self.results) % 25 == 0:
+            self.status_label.setText(self._summary("Decoding..."))
+
+    def on_failed(self, message):
+        QMessageBox.critical(self, "Error", f"Bulk import failed: {message}")
+
+    def on_finished(self):
+        cancelled = self.thread.cancel_event.is_set()
+        self.set_running(False)
+        self.export_btn.setEnabled(bool(self.results))
+        self.status_label.setText(self._summary("Cancelled." if cancelled else "Done."))
+
+    def on_cancel(self):
+        if self.thread is not None:
+            self.thread.cancel_event.set()
+            self.cancel_btn.setEnabled(False)
+            self.status_label.setText("Cancelling...")
+
+    def on_export(self):
+        filename, _ = QFileDialog.getSaveFileName(self, "Export Results", "qr_import.jsonl", "JSON Lines (*.jsonl)")
+        if not filename:
+            return
+        try:
+            with open_private(filename, "w", encoding="utf-8") as f:
+                write_jsonl(self.results, f)
+            self.status_label.setText(f"Exported {len(self.results)} result(s) to {filename}")
+        except OSError as e:
+            QMessageBox.critical(self, "Error", f"Failed to export results: {e}")
+
+    # ---------------------------------------------------------
+    # 🔧 Helpers
+    # ---------------------------------------------------------
+    def set_running(self, running):
+        self.folder_btn.setEnabled(not running)
+        self.archive_btn.setEnabled(not running)
+        self.camera_btn.setEnabled(not running)
+        self.multi_check.setEnabled(not running)
+        self.cancel_btn.setEnabled(running)
+        self.export_btn.setEnabled(False if running else bool(self.results))
+
+    def refresh_payloads(self):
+        for row, result in enumerate(self.results):
+            self.table.item(row, 1).setText(self._payload_text(result))
+
+    def _payload_text(self, result):
+        if result.payload is None:
+            return ""
+        return result.payload if self.show_payloads.isChecked() else "•" * min(len(result.payload), 16)
+
+    def _summary(self, prefix):
+        failed = sum(1 for result in self.results if result.error)
+        return f"{prefix} {len(self.results) - failed} decoded, {failed} failed"
+
+    # ---------------------------------------------------------
+    # 🚪 Cleanup
+    # ---------------------------------------------------------
+    def done(self, result):
+        if self.thread is not None and self.thread.isRunning():
+            self.thread.cancel_event.set()
+            self.thread.wait()
+        super().done(result)
@@ -0,0 +1,131 @@
+# dialog/camera_scan_dialog.py
+# ---------------------------------------------------------
+# 📷 Camera Scan Dialog - Cryptext Gen Pro
+# ---------------------------------------------------------
+# Live camera preview while a QR code is scanned on
+# background threads. Closes itself once a code is read,
+# or in multi mode collects every code until Done.
+# ---------------------------------------------------------
+import time
+
+from PyQt5.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton
+from PyQt5.QtGui import QPixmap, QPainter, QPen, QColor, QPolygonF, QIcon
+from PyQt5.QtCore import Qt, QPointF
+from app_config.app_config import APP_NAME, QR_SCAN_PREVIEW_WIDTH, ICON_PATH
+from ui.camera_scanner import CameraScanner
+
+
+class CameraScanDialog(QDialog):
+    """Camera preview dialog.
+
+    decoded_text is set when a QR code is read. With multi=True every
+    code seen is collected in decoded_texts (first-seen order) until the
+    user presses Done.
+    """
+
+    def __init__(self, qr_handler, camera_index=0, multi=False, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle(f"{APP_NAME} - Scan QR Code{'s' if multi else ''}")
+        self.setWindowIcon(QIcon(ICON_PATH))
+        self.setModal(True)
+
+        self.multi = multi
+        self.decoded_text = None
+        self.decoded_texts = []
+        self.error = None
+        self._polygons = []
+        self._frames = 0
+        self._started_at = time.perf_counter()
+
+        self.scanner = CameraScanner(qr_handler, multi=multi, parent=self)
+        self.scanner.preview.connect(self.on_preview)
+        self.scanner.located.connect(self.on_located)
+        self.scanner.decoded.connect(self.on_decoded)
+        self.scanner.decoded_all.connect(self.on_decoded_all)
+        self.scanner.failed.connect(self.on_failed)
+
+        self.setup_ui()
+        self.scanner.start(camera_index)
+
+    # ---------------------------------------------------------
+    # 🧱 UI Structure
+    # ---------------------------------------------------------
+    def setup_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(16, 16, 16, 16)
+        layout.setSpacing(10)
+
+        self.preview_label = QLabel("Starting camera...")
+        self.preview_label.setAlignment(Qt.AlignCenter)
+        self.preview_label.setMinimumSize(QR_SCAN_PREVIEW_WIDTH, QR_SCAN_PREVIEW_WIDTH * 3 // 4)
+        layout.addWidget(self.preview_label)
+
+        self.status_label = QLabel("Hold the QR code in front of the camera.")
+        self.status_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.status_label)
+
+        btn_layout = QHBoxLayout()
+        btn_layout.addStretch()
+        if self.multi:
+            self.done_btn = QPushButton("Done")
+            self.done_btn.setEnabled(False)
+            self.done_btn.clicked.connect(self.accept)
+            btn_layout.addWidget(self.done_btn)
+        cancel_btn = QPushButton("Cancel")
+        cancel_btn.clicked.connect(self.reject)
+        btn_layout.addWidget(cancel_btn)
+        layout.addLayout(btn_layout)
+
+    # ---------------------------------------------------------
+    # 📷 Scanner Events
+    # ---------------------------------------------------------
+    def on_preview(self, qimage):
+        """Show a camera frame, outlining the last located QR codes"""
+        self._frames += 1
+        pixmap = QPixmap.fromImage(qimage)
+
+        if self._polygons:
+            painter = QPainter(pixmap)
+            painter.setPen(QPen(QColor(0, 200, 0), 3))
+            for corners in self._polygons:
+                painter.drawPolygon(QPolygonF([QPointF(float(x), float(y)) for x, y in corners]))
+            painter.end()
+
+        self.preview_label.setPixmap(pixmap)
+
+        elapsed = time.perf_counter() - self._started_at
+        if elapsed > 0 and self._frames % 15 == 0:
+            found = f", {len(self.decoded_texts)} code(s) found" if self.multi else ""
+            self.status_label.setText(f"Scanning... ({self._frames / elapsed:.0f} fps{found})")
+
+    def on_located(self, polygons):
+        self._polygons = polygons
+
+    def on_decoded_all(self, codes, latency_ms):
+        """Collect every new code seen in a frame (multi mode)"""
+        for text, _ in codes:
+            if text not in self.decoded_texts:
+                self.decoded_texts.append(text)
+        self.done_btn.setEnabled(True)
+        self.status_label.setText(f"{len(self.decoded_texts)} code(s) found ({latency_ms:.0f} ms)")
+
+    def on_decoded(self, text, latency_ms):
+        self.decoded_text = text
+        self.status_label.setText(f"QR code detected ({latency_ms:.0f} ms)")
+        self.accept()
+
+    def on_failed(self, message):
+        self.error = message
+        self.status_label.setText(message)
+        self.preview_label.setText("📷 No camera feed")
+
+    # ---------------------------------------------------------
+    # 🚪 Cleanup
+    # ---------------------------------------------------------
+    def done(self, result):
+        self.scanner.stop()
+        super().done(result)
+
+    def closeEvent(self, event):
+        self.scanner.stop()
+        super().closeEvent(event)
@@ -17,7 +17,9 @@ from app_config.app_config import (
     APP_NAME, APP_VERSION, AUTHOR, APP_DEVELOPER,
     GITHUB_ID, PAYPAL_ID, KOFI_ID, BTC_ID, ETH_ID, HASH_NAME , DONATE_ICON_PATH
 )
-import resources_rc
+from utils.resource_loader import ResourceLoader
+
+ResourceLoader.ensure_loaded()
 
 class DonateDialog(QDialog):
     """Modern donation dialog supporting multi-platform links."""
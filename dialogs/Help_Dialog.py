@@ -17,7 +17,9 @@ from PyQt5.QtCore import Qt
 from app_config.app_config import (
     APP_NAME, HELP_ICON_PATH, DARK_THEME_QSS, LIGHT_THEME_QSS
 )
-import resources_rc
+from utils.resource_loader import ResourceLoader
+
+ResourceLoader.ensure_loaded()
 
 
 class HelpDialog(QDialog):
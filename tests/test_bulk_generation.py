@@ -0,0 +1,32 @@
+# tests/test_bulk_generation.py
+"""Bulk generators reject bad options when called, not on first next()"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.passphrase_generator import PassphraseGenerator  # noqa: E402
+from core.password_generator import PasswordGenerator  # noqa: E402
+
+
+def test_password_options_validated_eagerly():
+    with pytest.raises(ValueError):
+        PasswordGenerator().generate_many(5, 16, False, False, False, False)
+
+
+def test_empty_wordlist_validated_eagerly():
+    with pytest.raises(ValueError):
+        PassphraseGenerator([]).generate_many(5, 6)
+
+
+def test_zero_length_gives_empty_credentials():
+    assert list(PasswordGenerator().generate_many(3, 0)) == ["", "", ""]
+    assert list(PassphraseGenerator(["a", "b"]).generate_many(3, 0)) == ["", "", ""]
+
+
+def test_bulk_passwords_use_charset():
+    passwords = list(PasswordGenerator().generate_many(100, 12, use_upper=False, use_symbols=False))
+    assert len(passwords) == 100
+    assert all(len(p) == 12 and p.isalnum() and p == p.lower() for p in passwords)
@@ -0,0 +1,41 @@
+# tests/test_credential_exporter.py
+"""CredentialExporter replaces the target only after a complete export"""
+import os
+import stat
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.credential_exporter import CredentialExporter  # noqa: E402
+
+
+def _failing_credentials():
+    yield "first"
+    raise RuntimeError("generator failed mid-stream")
+
+
+def test_export_writes_all_formats(tmp_path):
+    for name in ("out.csv", "out.jsonl", "out.xml"):
+        path = tmp_path / name
+        assert CredentialExporter().export(["a", "b", "c"], str(path)) == 3
+        assert "b" in path.read_text(encoding="utf-8")
+
+
+def test_failed_export_keeps_previous_file(tmp_path):
+    path = tmp_path / "keep.csv"
+    path.write_text("precious\n")
+    with pytest.raises(RuntimeError):
+        CredentialExporter().export(_failing_credentials(), str(path))
+    assert path.read_text() == "precious\n"
+    assert os.listdir(tmp_path) == ["keep.csv"]
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX permissions")
+def test_export_is_owner_only(tmp_path):
+    path = tmp_path / "out.csv"
+    path.write_text("old\n")
+    path.chmod(0o644)
+    CredentialExporter().export(["secret"], str(path))
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
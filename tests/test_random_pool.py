@@ -0,0 +1,55 @@
+# tests/test_random_pool.py
+"""RandomBytePool must never hand the same bytes to two processes"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.passphrase_generator import PassphraseGenerator  # noqa: E402
+from core.password_generator import PasswordGenerator  # noqa: E402
+from core.random_pool import RandomBytePool  # noqa: E402
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+
+CHILDREN = 3
+
+
+def _outputs_across_fork(draw):
+    """draw() in the parent and in CHILDREN forked children, after a warm-up draw"""
+    draw()  # fills the pre-fetched buffer before forking
+    results = []
+    for _ in range(CHILDREN):
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            try:
+                os.write(write_fd, repr(draw()).encode())
+            finally:
+                os._exit(0)
+        os.close(write_fd)
+        with os.fdopen(read_fd, "rb") as f:
+            results.append(f.read())
+        os.waitpid(pid, 0)
+    results.append(repr(draw()).encode())
+    return results
+
+
+def test_pool_bytes_differ_after_fork():
+    pool = RandomBytePool()
+    results = _outputs_across_fork(lambda: pool.read(32))
+    assert len(set(results)) == len(results)
+
+
+def test_bulk_passwords_differ_after_fork():
+    generator = PasswordGenerator()
+    results = _outputs_across_fork(lambda: list(generator.generate_many(2, 16)))
+    assert len(set(results)) == len(results)
+
+
+def test_bulk_passphrases_differ_after_fork():
+    generator = PassphraseGenerator([f"word{i}" for i in range(1024)])
+    results = _outputs_across_fork(lambda: list(generator.generate_many(2, 6, "-", "random case")))
+    assert len(set(results)) == len(results)
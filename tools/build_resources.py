@@ -0,0 +1,78 @@
+# tools/build_resources.py
+"""Build the binary Qt resource bundle (resources.rcc) from resources_rc.py
+
+Qt memory-maps a registered .rcc file, so the application no longer has to
+unmarshal the 61k-line resources_rc.py bytes literal and keep a copy of it
+in the Python heap. The generated module stays as a fallback.
+
+The bundle is rebuilt from the data/name/struct tables already compiled
+into resources_rc.py, so no Qt tooling is needed. With a .qrc source and
+Qt's rcc on hand, `rcc -binary resources.qrc -o resources.rcc` is equivalent.
+
+Usage:
+    python tools/build_resources.py [--source resources_rc.py] [--output resources.rcc]
+"""
+import argparse
+import ast
+import os
+import struct
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+RCC_MAGIC = b"qres"
+RCC_VERSION = 2  # resource tree with last-modified timestamps (Qt >= 5.8)
+HEADER_SIZE = 20  # magic + version + tree/data/name offsets
+
+
+def read_tables(source_path):
+    """Extract the resource tables from a pyrcc5-generated module
+
+    The module is parsed, not imported, so PyQt5 is not required.
+    """
+    with open(source_path, "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=source_path)
+
+    wanted = {"qt_resource_data", "qt_resource_name", "qt_resource_struct_v2"}
+    tables = {}
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1:
+            target = node.targets[0]
+            if isinstance(target, ast.Name) and target.id in wanted:
+                tables[target.id] = ast.literal_eval(node.value)
+
+    missing = wanted - tables.keys()
+    if missing:
+        raise ValueError(f"{source_path} is missing: {', '.join(sorted(missing))}")
+    return tables["qt_resource_data"], tables["qt_resource_name"], tables["qt_resource_struct_v2"]
+
+
+def build_rcc(data, names, tree):
+    """Assemble an rcc binary: header, data, names, tree (same order as rcc)"""
+    data_offset = HEADER_SIZE
+    names_offset = data_offset + len(data)
+    tree_offset = names_offset + len(names)
+    header = RCC_MAGIC + struct.pack(">IIII", RCC_VERSION, tree_offset, data_offset, names_offset)
+    return header + data + names + tree
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build resources.rcc from resources_rc.py")
+    parser.add_argument("--source", default=os.path.join(ROOT, "resources_rc.py"))
+    parser.add_argument("--output", default=os.path.join(ROOT, "resources.rcc"))
+    args = parser.parse_args()
+
+    try:
+        bundle = build_rcc(*read_tables(args.source))
+    except (OSError, SyntaxError, ValueError) as e:
+        print(f"❌ Failed to read resources: {e}", file=sys.stderr)
+        return 1
+
+    with open(args.output, "wb") as f:
+        f.write(bundle)
+    print(f"✅ Wrote {len(bundle):,} bytes to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,47 @@
+# tools/compile_wordlist.py
+"""Compile a text wordlist (.wordlist) into the memory-mapped .cwl format
+
+A compiled wordlist is opened by mapping the file and reading a 56-byte
+header; words are decoded only when a passphrase picks them. For custom
+lists with hundreds of thousands of words this replaces parsing the text
+file into a list of str at every startup. WordlistLoader.load accepts
+either format.
+
+Usage:
+    python tools/compile_wordlist.py SOURCE [--output OUTPUT] [--keep-duplicates] [--verify]
+"""
+import argparse
+import math
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from core.compiled_wordlist import COMPILED_WORDLIST_EXT, CompiledWordlist, compile_wordlist  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile a text wordlist into the .cwl format")
+    parser.add_argument("source", help="Text wordlist (one word per line, or EFF '12345<TAB>word')")
+    parser.add_argument("--output", help=f"Compiled file (default: SOURCE with {COMPILED_WORDLIST_EXT})")
+    parser.add_argument("--keep-duplicates", action="store_true", help="Keep repeated words")
+    parser.add_argument("--verify", action="store_true", help="Re-open the output and check its SHA-256")
+    args = parser.parse_args()
+
+    output = args.output or os.path.splitext(args.source)[0] + COMPILED_WORDLIST_EXT
+    try:
+        count = compile_wordlist(args.source, output, dedupe=not args.keep_duplicates)
+        if args.verify:
+            CompiledWordlist(output, verify=True).close()
+    except (OSError, UnicodeDecodeError, ValueError) as e:
+        print(f"❌ Failed to compile wordlist: {e}", file=sys.stderr)
+        return 1
+
+    bits = f", {math.log2(count):.2f} bits/word" if count else ""
+    print(f"✅ Wrote {count:,} words ({os.path.getsize(output):,} bytes{bits}) to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
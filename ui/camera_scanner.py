@@ -0,0 +1,324 @@
+# ui/camera_scanner.py
+"""Non-blocking camera QR scanning: capture and decode on worker threads"""
+import sys
+import threading
+import time
+
+from PyQt5.QtCore import QObject, QThread, pyqtSignal
+from PyQt5.QtGui import QImage
+
+from app_config.app_config import (
+    CAMERA_BACKEND, MAX_CAMERA_ATTEMPTS, QR_SCAN_DECODE_WIDTH, QR_SCAN_PREVIEW_WIDTH
+)
+
+
+class _LatestFrame:
+    """Single-slot mailbox: a new frame replaces any frame not yet taken
+
+    This is how frames are dropped while the decoder is busy: the capture
+    thread never waits on it, and the decoder always gets the newest frame.
+    """
+
+    def __init__(self):
+        self._frame = None
+        self._captured_at = None
+        self._closed = False
+        self._cond = threading.Condition()
+
+    def put(self, frame, captured_at):
+        with self._cond:
+            self._frame, self._captured_at = frame, captured_at
+            self._cond.notify()
+
+    def take(self, timeout=0.5):
+        """Wait for the next frame; returns (frame, captured_at) or (None, None)"""
+        with self._cond:
+            if self._frame is None and not self._closed:
+                self._cond.wait(timeout)
+            frame, captured_at = self._frame, self._captured_at
+            self._frame = self._captured_at = None
+            return frame, captured_at
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+
+class _CaptureThread(QThread):
+    """Reads camera frames, publishes previews and feeds the decoder mailbox"""
+
+    preview_ready = pyqtSignal(object)  # QImage
+    failed = pyqtSignal(str)
+
+    def __init__(self, scanner, camera_index):
+        super().__init__()
+        self.scanner = scanner
+        self.camera_index = camera_index
+        self.frames_captured = 0
+        self.previews_dropped = 0
+        self._preview_pending = False
+
+    def run(self):
+        try:
+            cv2 = self.scanner.qr_handler.cv2
+            cap = self._open_camera(cv2)
+        except Exception as e:
+            self.failed.emit(f"Camera unavailable: {e}")
+            return
+
+        try:
+            while not self.isInterruptionRequested():
+                ret, frame = cap.read()
+                if not ret:
+                    self.failed.emit("Camera stopped delivering frames")
+                    break
+
+                self.frames_captured += 1
+                self.scanner._mailbox.put(frame, time.perf_counter())
+                self._publish_preview(cv2, frame)
+        finally:
+            cap.release()
+
+    def _open_camera(self, cv2):
+        """Open the camera, retrying up to MAX_CAMERA_ATTEMPTS times"""
+        api = cv2.CAP_ANY
+        if CAMERA_BACKEND and sys.platform.startswith("win"):
+            api = getattr(cv2, f"CAP_{CAMERA_BACKEND}", cv2.CAP_ANY)
+
+        for _ in range(MAX_CAMERA_ATTEMPTS):
+            cap = cv2.VideoCapture(self.camera_index, api)
+            if cap.isOpened():
+                cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # keep latency at one frame
+                cap.set(cv2.CAP_PROP_FPS, 30)
+                return cap
+            cap.release()
+            if self.isInterruptionRequested():
+                break
+            self.msleep(200)
+
+        raise RuntimeError(f"could not open camera {self.camera_index}")
+
+    def _publish_preview(self, cv2, frame):
+        """Emit a scaled RGB preview unless the GUI has not shown the last one yet"""
+        if self._preview_pending:
+            self.previews_dropped += 1
+            return
+
+        height, width = frame.shape[:2]
+        if width > QR_SCAN_PREVIEW_WIDTH:
+            scale = QR_SCAN_PREVIEW_WIDTH / width
+            frame = cv2.resize(frame, (QR_SCAN_PREVIEW_WIDTH, int(height * scale)), interpolation=cv2.INTER_AREA)
+        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+
+        height, width = rgb.shape[:2]
+        qimage = QImage(rgb.data, width, height, rgb.strides[0], QImage.Format_RGB888)
+        qimage._pixel_data = rgb  # keep the buffer alive while the QImage is in flight
+
+        self._preview_pending = True
+        self.preview_ready.emit(qimage)
+
+
+class _DecodeThread(QThread):
+    """Decodes the newest captured frame on a downscaled grayscale image
+
+    A long-lived cv2.QRCodeDetector runs on the frame scaled to
+    QR_SCAN_DECODE_WIDTH. When it locates a code but cannot read it (too
+    small or blurred at that scale), the next frames are decoded at full
+    resolution inside that region only.
+
+    In multi mode every code in the frame is located and decoded (see
+    PreprocessPipeline.decode_multi) and scanning continues until stopped.
+    """
+
+    decoded = pyqtSignal(str, float)  # text, capture-to-decode latency (ms)
+    decoded_all = pyqtSignal(object, float)  # [(text, corners in preview coordinates)], latency (ms)
+    located = pyqtSignal(object)  # list of corner arrays in preview coordinates
+    failed = pyqtSignal(str)
+
+    def __init__(self, scanner):
+        super().__init__()
+        self.scanner = scanner
+        self.frames_decoded = 0
+        self._roi = None  # (x0, y0, x1, y1) in full-resolution pixels
+
+    def run(self):
+        handler = self.scanner.qr_handler
+        try:
+            cv2 = handler.cv2
+            detector = cv2.QRCodeDetector()
+        except Exception as e:
+            self.failed.emit(f"QR decoder unavailable: {e}")
+            return
+        zbar_decode = handler.zbar_decode
+
+        while not self.isInterruptionRequested():
+            frame, captured_at = self.scanner._mailbox.take()
+            if frame is None:
+                continue
+
+            if self.scanner.multi:
+                self._decode_all(cv2, handler, frame, captured_at)
+                self.frames_decoded += 1
+                continue
+
+            text = self._decode(cv2, detector, zbar_decode, frame)
+            self.frames_decoded += 1
+            if text:
+                self.decoded.emit(text, (time.perf_counter() - captured_at) * 1000)
+                return
+
+    def _decode(self, cv2, detector, zbar_decode, frame):
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        height, width = gray.shape
+
+        if self._roi is not None:
+            x0, y0, x1, y1 = self._roi
+            self._roi = None
+            text = self._read(detector, zbar_decode, gray[y0:y1, x0:x1])
+            if text:
+                return text
+
+        scale = min(1.0, QR_SCAN_DECODE_WIDTH / width)
+        small = gray if scale == 1.0 else cv2.resize(
+            gray, (int(width * scale), int(height * scale)), interpolation=cv2.INTER_AREA
+        )
+
+        text, points, _ = detector.detectAndDecode(small)
+        if points is None:
+            self.located.emit([])
+        else:
+            corners = points.reshape(-1, 2) / scale
+            self.located.emit([corners * (min(1.0, QR_SCAN_PREVIEW_WIDTH / width))])
+            if not text:
+                self._roi = self._region(corners, width, height)
+        if text:
+            return text
+        return self._read_zbar(zbar_decode, small)
+
+    def _decode_all(self, cv2, handler, frame, captured_at):
+        """Decode every code in the frame and report them with preview positions"""
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        preview_scale = min(1.0, QR_SCAN_PREVIEW_WIDTH / gray.shape[1])
+
+        found = [
+            (detection.text, [(x * preview_scale, y * preview_scale) for x, y in detection.points])
+            for detection in handler.decode_image_multi(gray)
+        ]
+        self.located.emit([points for _, points in found])
+        if found:
+            self.decoded_all.emit(found, (time.perf_counter() - captured_at) * 1000)
+
+    def _read(self, detector, zbar_decode, image):
+        """Decode a (cropped) grayscale image with OpenCV, then pyzbar"""
+        if image.size == 0:
+            return None
+        text, _, _ = detector.detectAndDecode(image)
+        return text or self._read_zbar(zbar_decode, image)
+
+    @staticmethod
+    def _read_zbar(zbar_decode, image):
+        if zbar_decode is None:
+            return None
+        results = zbar_decode(image)
+        if results:
+            return results[0].data.decode("utf-8", errors="replace")
+        return None
+
+    @staticmethod
+    def _region(corners, width, height):
+        """Bounding box of corners grown by 25% on each side, clipped to the frame"""
+        x0, y0 = corners.min(axis=0)
+        x1, y1 = corners.max(axis=0)
+        pad_x, pad_y = (x1 - x0) * 0.25, (y1 - y0) * 0.25
+        return (max(0, int(x0 - pad_x)), max(0, int(y0 - pad_y)),
+                min(width, int(x1 + pad_x)), min(height, int(y1 + pad_y)))
+
+
+class CameraScanner(QObject):
+    """Scans a QR code from a camera without blocking the GUI thread
+
+    Capture and decoding run on separate QThreads. The capture thread runs
+    at the camera's frame rate and streams previews; the decoder always
+    works on the newest frame, so frames arriving while it is busy are
+    dropped instead of queued.
+
+    Signals:
+        preview(QImage): camera frame scaled to QR_SCAN_PREVIEW_WIDTH
+        located(polygons): corners of each code found in the last decoded
+            frame, in preview coordinates (empty list if none)
+        decoded(text, latency_ms): first code read; scanning stops
+        decoded_all(codes, latency_ms): multi mode only, every
+            (text, corners) read in a frame; scanning continues
+        failed(message): camera could not be opened or stopped working
+    """
+
+    preview = pyqtSignal(object)
+    located = pyqtSignal(object)
+    decoded = pyqtSignal(str, float)
+    decoded_all = pyqtSignal(object, float)
+    failed = pyqtSignal(str)
+
+    def __init__(self, qr_handler, multi=False, parent=None):
+        super().__init__(parent)
+        self.qr_handler = qr_handler
+        self.multi = multi
+        self._mailbox = None
+        self._capture = None
+        self._decoder = None
+
+    def start(self, camera_index=0):
+        """Open the camera and start scanning"""
+        self.stop()
+        self._mailbox = _LatestFrame()
+
+        self._capture = _CaptureThread(self, camera_index)
+        self._capture.preview_ready.connect(self._on_preview)
+        self._capture.failed.connect(self._on_failed)
+
+        self._decoder = _DecodeThread(self)
+        self._decoder.decoded.connect(self._on_decoded)
+        self._decoder.decoded_all.connect(self.decoded_all)
+        self._decoder.located.connect(self.located)
+        self._decoder.failed.connect(self._on_failed)
+
+        self._decoder.start()
+        self._capture.start()
+
+    def is_running(self):
+        return self._capture is not None and self._capture.isRunning()
+
+    def stop(self):
+        """Stop both threads and release the camera"""
+        if self._capture is None or self._capture.isInterruptionRequested():
+            return
+
+        for thread in (self._capture, self._decoder):
+            thread.requestInterruption()
+        self._mailbox.close()
+        for thread in (self._capture, self._decoder):
+            thread.wait()
+
+    def stats(self):
+        """Frame counters for the current or last session"""
+        if self._capture is None:
+            return {}
+        return {
+            "captured": self._capture.frames_captured,
+            "decoded": self._decoder.frames_decoded,
+            "previews_dropped": self._capture.previews_dropped,
+        }
+
+    def _on_preview(self, qimage):
+        if self.sender() is not self._capture or self._capture.isInterruptionRequested():
+            return  # late frame from a stopped session
+        self._capture._preview_pending = False
+        self.preview.emit(qimage)
+
+    def _on_decoded(self, text, latency_ms):
+        self.stop()
+        self.decoded.emit(text, latency_ms)
+
+    def _on_failed(self, message):
+        self.stop()
+        self.failed.emit(message)
@@ -4,7 +4,6 @@
 import os
 import sys
 import warnings
-import cv2
 import logging
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QHBoxLayout, QLabel,
@@ -12,14 +11,13 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtCore import Qt, QTimer, QTime, QDate
 from app_config.app_config import (
     WORDLIST_PATH, ICON_PATH, WINDOW_WIDTH, WINDOW_HEIGHT, WINDOW_TITLE,
-    APP_NAME, APP_VERSION, LOGO_PATH
+    APP_NAME, APP_VERSION, LOGO_PATH, QR_PREWARM_BACKENDS, QR_PREWARM_DELAY_MS
 )
 
 from PyQt5.QtGui import QKeySequence
 
 from core.password_generator import PasswordGenerator
 from core.passphrase_generator import PassphraseGenerator
-from core.wordlist_loader import WordlistLoader
 from core.strength_analyzer import StrengthAnalyzer
 from core.qr_handler import QRHandler
 from utils.clipboard_manager import ClipboardManager
@@ -27,7 +25,11 @@ from utils.file_handler import FileHandler
 from dialogs.Help_Dialog import HelpDialog
 from dialogs.About_Dialog import AboutDialog
 from dialogs.Donate_Dialog import DonateDialog
-import resources_rc
+from dialogs.Bulk_Import_Dialog import BulkImportDialog
+from ui.wordlist_loading import AsyncWordlistLoader
+from utils.resource_loader import ResourceLoader
+
+ResourceLoader.ensure_loaded()
 
 #Silences Python DeprecationWarnings
 warnings.filterwarnings("ignore", category=DeprecationWarning)
@@ -56,18 +58,6 @@ def setup_logger(log_file="CryptextGenPro.log"):
     return logger
 
 
-# --------------------------
-# Safe OpenCV Initialization
-# --------------------------
-try:
-    if hasattr(cv2, "setLogLevel"):
-        cv2.setLogLevel(cv2.LOG_LEVEL_SILENT)
-except Exception:
-    pass
-os.environ["OPENCV_VIDEOIO_PRIORITY_MSMF"] = "0"
-logging.getLogger("pyzbar").setLevel(logging.ERROR)
-
-
 # --------------------------
 # Main Window
 # --------------------------
@@ -80,12 +70,6 @@ class SecurePassPro(QMainWindow):
         self.logger = setup_logger()
         self.logger.info(f"Launching {APP_NAME} v{APP_VERSION}")
 
-        try:
-            self.DICEWARE_WORDS = self._load_wordlist(r"assets\wordlist\eff_file.wordlist")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to load wordlist:\n{e}")
-            self.DICEWARE_WORDS = []
-
         # Initialize core components
         self.password_gen = PasswordGenerator()
         self.strength_analyzer = StrengthAnalyzer()
@@ -97,8 +81,11 @@ class SecurePassPro(QMainWindow):
         self.current_qr_image = None
         self.logo_path = LOGO_PATH
 
-        # Load wordlist safely
-        self.passphrase_gen = PassphraseGenerator(self._load_wordlist())
+        # Wordlist loads in the background; passphrase mode unlocks when ready
+        self.passphrase_gen = PassphraseGenerator()
+        self.wordlist_loader = AsyncWordlistLoader(self)
+        self.wordlist_loader.loaded.connect(self.on_wordlist_loaded)
+        self.wordlist_loader.failed.connect(self.on_wordlist_failed)
 
         # State tracking
         self.current_qr_image = None
@@ -110,27 +97,27 @@ class SecurePassPro(QMainWindow):
         # After menu bar creation
         self.init_shortcuts()
 
+        self.load_wordlist(WORDLIST_PATH)
+
     # --------------------------
-    # Wordlist loader with fallback
+    # Wordlist (loaded off the GUI thread)
     # --------------------------
-    def _load_wordlist(self, path=r"assets\wordlist\eff_file.wordlist"):
-        """Load words from an external Diceware/EFF wordlist file"""
-        if not os.path.exists(path):
-            raise FileNotFoundError(f"Wordlist file not found: {path}")
-
-        words = []
-        with open(path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                # EFF wordlists usually have "12345\tword"
-                parts = line.split()
-                if len(parts) == 2:
-                    words.append(parts[1])
-                else:
-                    words.append(parts[0])  # fallback if no numbers
-        return words
+    def load_wordlist(self, path=None):
+        """Load a wordlist in the background; passphrase mode is disabled meanwhile"""
+        self.control_panel.set_wordlist_state("loading")
+        self.wordlist_loader.load(path)
+
+    def on_wordlist_loaded(self, words, elapsed_ms):
+        self.passphrase_gen = PassphraseGenerator(words)
+        self.control_panel.set_wordlist_state("ready")
+        self.statusBar().showMessage(f"Wordlist ready ({len(words):,} words)", 3000)
+        self.logger.info(f"Wordlist loaded: {len(words):,} words in {elapsed_ms:.0f} ms")
+
+    def on_wordlist_failed(self, message):
+        self.passphrase_gen = PassphraseGenerator()
+        self.control_panel.set_wordlist_state("failed", message)
+        self.logger.error(f"Failed to load wordlist: {message}")
+        self.statusBar().showMessage(f"Failed to load wordlist: {message}")
 
     # --------------------------
     # UI Initialization
@@ -254,6 +241,11 @@ class SecurePassPro(QMainWindow):
 
         # File Menu
         file_menu = menubar.addMenu("File")
+        bulk_import_action = QAction("Bulk Import QR Codes...", self)
+        bulk_import_action.triggered.connect(self.show_bulk_import_dialog)
+        file_menu.addAction(bulk_import_action)
+        file_menu.addSeparator()
+
         exit_action = QAction("Exit", self)
         exit_action.triggered.connect(self.close)
         file_menu.addAction(exit_action)
@@ -280,9 +272,33 @@ class SecurePassPro(QMainWindow):
     def show_about_dialog(self): AboutDialog(self).exec_()
     def show_donate_dialog(self): DonateDialog(self).exec_()
     def show_help_dialog(self): HelpDialog(self).exec_()
+    def show_bulk_import_dialog(self): BulkImportDialog(self.qr_handler, self).exec_()
     def show_terms_conditions_dialog(self): TermsConditionsDialog(self).exec_()
     def show_license_dialog(self): LicenseDialog(self).exec_()
 
+    # --------------------------
+    # QR Scan Backends
+    # --------------------------
+    def prewarm_qr_backends(self, import_report=None):
+        """Load OpenCV/pyzbar in the background once the window is up
+
+        Scanning otherwise pays the import cost on the first Scan/Upload
+        click. Disabled with QR_PREWARM_BACKENDS = False.
+        """
+        if not QR_PREWARM_BACKENDS:
+            return
+
+        def _on_loaded(error):
+            if error:
+                self.logger.warning(f"⚠️ QR scan backends unavailable: {error}")
+                return
+            self.logger.info(f"QR scan backends loaded in "
+                             f"{self.qr_handler.backend_load_time * 1000:.0f} ms")
+            if import_report:
+                self.logger.info(import_report.mark("QR scan backends loaded"))
+
+        QTimer.singleShot(QR_PREWARM_DELAY_MS, lambda: self.qr_handler.prewarm(_on_loaded))
+
     # --------------------------
     # Clock
     # --------------------------
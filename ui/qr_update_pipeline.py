@@ -0,0 +1,166 @@
+# ui/qr_update_pipeline.py
+"""Debounced, off-thread QR preview rendering for live text edits"""
+import time
+from collections import deque
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+from PyQt5.QtGui import QPixmap
+
+from app_config.app_config import QR_SIZE, QR_UPDATE_DEBOUNCE_MS
+
+
+class _RenderSignals(QObject):
+    """Signals emitted from the worker back to the GUI thread"""
+    finished = pyqtSignal(int, str, object, object)  # generation, text, QImage, PIL image
+    failed = pyqtSignal(int, str)
+
+
+class _RenderTask(QRunnable):
+    """Renders one QR payload on a pool thread"""
+
+    def __init__(self, pipeline, generation, text):
+        super().__init__()
+        self.pipeline = pipeline
+        self.generation = generation
+        self.text = text
+        self.signals = pipeline._signals
+
+    def run(self):
+        # Skip work that was superseded while queued
+        if self.generation != self.pipeline.generation:
+            return
+
+        try:
+            handler = self.pipeline.qr_handler
+            qr_img = handler.generate(self.text, self.pipeline.logo_path, size=self.pipeline.size)
+            qimage = handler.to_qimage(qr_img, self.pipeline.size)
+        except Exception as e:
+            self.signals.failed.emit(self.generation, str(e))
+            return
+
+        self.signals.finished.emit(self.generation, self.text, qimage, qr_img)
+
+
+class QRUpdatePipeline(QObject):
+    """Coalesces rapid text changes into one background QR render
+
+    Every request() restarts a short debounce timer; when it fires, the latest
+    text is rendered on a QThreadPool worker, directly at the preview size.
+    Results from older requests are discarded, so the preview only ever shows
+    the most recent text (available as current_text).
+
+    Signals:
+        qr_ready(QPixmap, PIL image, latency_ms): latency is measured from
+            the last keystroke to the pixmap being handed to the GUI
+        qr_cleared(): text became empty
+    """
+
+    qr_ready = pyqtSignal(object, object, float)
+    qr_cleared = pyqtSignal()
+    qr_failed = pyqtSignal(str)
+
+    LATENCY_WINDOW = 100  # keystroke-to-QR samples kept for latency_stats()
+
+    def __init__(self, qr_handler, logo_path=None, size=QR_SIZE, debounce_ms=QR_UPDATE_DEBOUNCE_MS,
+                 parent=None):
+        super().__init__(parent)
+        self.qr_handler = qr_handler
+        self.logo_path = logo_path
+        self.size = size
+        self.generation = 0
+        self.current_text = None
+
+        self._pending_text = None
+        self._requested_at = None
+        self._latencies = deque(maxlen=self.LATENCY_WINDOW)
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(debounce_ms)
+        self._timer.timeout.connect(self._dispatch)
+
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+
+        self._signals = _RenderSignals()
+        self._signals.finished.connect(self._on_finished)
+        self._signals.failed.connect(self._on_failed)
+
+    def request(self, text):
+        """Schedule a QR render for text (call on every edit)"""
+        self.generation += 1
+        self._requested_at = time.perf_counter()
+
+        if not text:
+            self._timer.stop()
+            self._pending_text = None
+            self.current_text = None
+            self.qr_cleared.emit()
+            return
+
+        self._pending_text = text
+        self._timer.start()
+
+    def is_pending(self):
+        """True while a render is waiting on the timer or running"""
+        return self._timer.isActive() or self._pending_text is not None
+
+    def flush(self):
+        """Render any pending text synchronously (e.g. before saving)
+
+        Returns:
+            The rendered PIL image, or None if nothing was pending
+        """
+        if not self.is_pending() or not self._pending_text:
+            return None
+
+        self._timer.stop()
+        text, self._pending_text = self._pending_text, None
+        self.generation += 1  # drop any in-flight worker result
+
+        qr_img = self.qr_handler.generate(text, self.logo_path, size=self.size)
+        pixmap = self.qr_handler.to_pixmap(qr_img, self.size)
+        self._publish(text, pixmap, qr_img)
+        return qr_img
+
+    def cancel(self):
+        """Drop pending and in-flight renders"""
+        self.generation += 1
+        self._timer.stop()
+        self._pending_text = None
+
+    def latency_stats(self):
+        """Keystroke-to-QR-displayed latency over recent renders (ms)"""
+        samples = sorted(self._latencies)
+        if not samples:
+            return {"count": 0, "last": None, "mean": None, "p95": None}
+        return {
+            "count": len(samples),
+            "last": self._latencies[-1],
+            "mean": sum(samples) / len(samples),
+            "p95": samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+        }
+
+    def _dispatch(self):
+        if self._pending_text:
+            self._pool.start(_RenderTask(self, self.generation, self._pending_text))
+
+    def _on_finished(self, generation, text, qimage, qr_img):
+        if generation != self.generation:
+            return  # stale: text changed since this render started
+
+        self._pending_text = None
+        pixmap = QPixmap.fromImage(qimage) if qimage is not None else None
+        self._publish(text, pixmap, qr_img)
+
+    def _on_failed(self, generation, message):
+        if generation != self.generation:
+            return
+        self._pending_text = None
+        self.qr_failed.emit(message)
+
+    def _publish(self, text, pixmap, qr_img):
+        self.current_text = text
+        latency_ms = (time.perf_counter() - self._requested_at) * 1000
+        self._latencies.append(latency_ms)
+        self.qr_ready.emit(pixmap, qr_img, latency_ms)
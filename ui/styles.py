@@ -11,7 +11,9 @@ import os
 import datetime
 from PyQt5.QtCore import QFile, QTextStream
 from app_config.app_config import DARK_THEME_QSS, LIGHT_THEME_QSS, APPLY_THEME
-import resources_rc
+from utils.resource_loader import ResourceLoader
+
+ResourceLoader.ensure_loaded()
 
 class StyleManager:
     """Manages application styling and theme switching."""
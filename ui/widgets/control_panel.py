@@ -6,7 +6,9 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtGui import QFont
 
-from app_config.app_config import APP_NAME, ABOUT_APP, LOGO_PATH
+from app_config.app_config import APP_NAME, ABOUT_APP, LOGO_PATH, QR_SIZE, QR_LATENCY_LOG_EVERY
+from dialogs.Camera_Scan_Dialog import CameraScanDialog
+from ui.qr_update_pipeline import QRUpdatePipeline
 from ui.widgets.password_tab import PasswordTab
 from ui.widgets.passphrase_tab import PassphraseTab
 
@@ -17,6 +19,15 @@ class ControlPanel(QWidget):
     def __init__(self, main_window):
         super().__init__()
         self.main_window = main_window
+        self.wordlist_state = "ready"  # "loading" while the wordlist loads in the background
+
+        # QR previews are rendered off the GUI thread, coalescing keystrokes
+        self.qr_pipeline = QRUpdatePipeline(main_window.qr_handler, LOGO_PATH, QR_SIZE, parent=self)
+        self.qr_pipeline.qr_ready.connect(self.on_qr_ready)
+        self.qr_pipeline.qr_cleared.connect(self.on_qr_cleared)
+        self.qr_pipeline.qr_failed.connect(self.on_qr_failed)
+        self._qr_renders = 0
+
         self.init_ui()
 
     def init_ui(self):
@@ -75,6 +86,12 @@ class ControlPanel(QWidget):
             self.password_tab.show()
             self.passphrase_tab.hide()
         else:
+            # Passphrase mode unlocks once the background load finishes
+            if self.wordlist_state == "loading":
+                self.main_window.statusBar().showMessage("⏳ Wordlist is still loading...")
+                self.password_radio.setChecked(True)
+                return
+
             # Check if wordlist is available before switching to passphrase mode
             if not self.main_window.passphrase_gen.is_ready():
                 QMessageBox.warning(
@@ -92,6 +109,19 @@ class ControlPanel(QWidget):
             self.password_tab.hide()
             self.passphrase_tab.show()
 
+    def set_wordlist_state(self, state, message=None):
+        """Reflect the wordlist load in the passphrase mode button
+
+        Args:
+            state: "loading" (button disabled), "ready" or "failed"
+            message: Optional tooltip, e.g. the load error
+        """
+        self.wordlist_state = state
+        loading = state == "loading"
+        self.passphrase_radio.setEnabled(not loading)
+        self.passphrase_radio.setText("📝 Passphrase (loading...)" if loading else "📝 Passphrase")
+        self.passphrase_radio.setToolTip("Loading wordlist..." if loading else (message or ""))
+
     def _connect_signals(self):
         """Connect tab signals to main window handlers"""
         # Password Tab Signals
@@ -118,7 +148,16 @@ class ControlPanel(QWidget):
             settings = self.password_tab.get_settings()
             length = settings["length"]
 
-            if length > 40:
+            # Advanced mode alternates types without repeats; fall back to
+            # basic only when the selected groups cannot support the length
+            max_advanced = self.main_window.password_gen.max_advanced_length(
+                settings["uppercase"],
+                settings["lowercase"],
+                settings["numbers"],
+                settings["symbols"]
+            )
+
+            if length > max_advanced:
                 password = self.main_window.password_gen.generate_basic(
                     length,
                     settings["uppercase"],
@@ -177,15 +216,10 @@ class ControlPanel(QWidget):
         if password:
             metrics = self.main_window.strength_analyzer.analyze(password)
             self.password_tab.update_strength(metrics)
-
-            qr_image = self.main_window.qr_handler.generate(password, LOGO_PATH)
-            self.main_window.current_qr_image = qr_image
-            pixmap = self.main_window.qr_handler.to_pixmap(qr_image, 220)
-            if pixmap:
-                self.main_window.info_panel.set_qr_pixmap(pixmap)
         else:
             self.password_tab.update_strength(self.main_window.strength_analyzer.analyze(""))
-            self.main_window.info_panel.clear_qr()
+
+        self.qr_pipeline.request(password)
 
     def on_passphrase_changed(self):
         """Handle passphrase text changes"""
@@ -193,15 +227,41 @@ class ControlPanel(QWidget):
         if passphrase:
             metrics = self.main_window.strength_analyzer.analyze(passphrase)
             self.passphrase_tab.update_strength(metrics)
-
-            qr_image = self.main_window.qr_handler.generate(passphrase, LOGO_PATH)
-            self.main_window.current_qr_image = qr_image
-            pixmap = self.main_window.qr_handler.to_pixmap(qr_image, 220)
-            if pixmap:
-                self.main_window.info_panel.set_qr_pixmap(pixmap)
         else:
             self.passphrase_tab.update_strength(self.main_window.strength_analyzer.analyze(""))
-            self.main_window.info_panel.clear_qr()
+
+        self.qr_pipeline.request(passphrase)
+
+    def on_qr_ready(self, pixmap, qr_image, latency_ms):
+        """Show a QR rendered by the update pipeline"""
+        self.main_window.current_qr_image = qr_image
+        if pixmap:
+            self.main_window.info_panel.set_qr_pixmap(pixmap)
+
+        # Summarize keystroke-to-QR latency in the log every few renders
+        self._qr_renders += 1
+        if self._qr_renders % QR_LATENCY_LOG_EVERY == 0:
+            stats = self.qr_pipeline.latency_stats()
+            self.main_window.logger.info(
+                f"QR preview latency over last {stats['count']} renders: "
+                f"mean {stats['mean']:.0f} ms, p95 {stats['p95']:.0f} ms, last {stats['last']:.0f} ms"
+            )
+
+    def on_qr_cleared(self):
+        """Clear QR preview when the text becomes empty
+
+        Also runs on Clear All, so cached QR matrices of the old credentials
+        are wiped.
+        """
+        self.main_window.current_qr_image = None
+        self.main_window.info_panel.clear_qr()
+        self.main_window.qr_handler.clear_cache()
+
+    def on_qr_failed(self, message):
+        """Report a failed background QR render"""
+        self.main_window.current_qr_image = None
+        self.main_window.info_panel.clear_qr()
+        self.main_window.statusBar().showMessage(f"QR generation failed: {message}")
 
     def on_copy_password(self):
         """Copy password to clipboard"""
@@ -264,6 +324,9 @@ class ControlPanel(QWidget):
         """Save QR code to file"""
         from utils.file_handler import FileHandler
 
+        # Make sure the QR matches the text even if a render is still pending
+        self.qr_pipeline.flush()
+
         if not self.main_window.current_qr_image:
             QMessageBox.warning(self, "Warning", "No QR code to save.")
             self.main_window.statusBar().showMessage("No QR code to save.")
@@ -277,19 +340,26 @@ class ControlPanel(QWidget):
         )
 
         if filename:
-            self.main_window.current_qr_image.save(filename)
+            # The preview is rendered at display size; save at full resolution
+            qr_image = self.main_window.qr_handler.generate(self.qr_pipeline.current_text or "", LOGO_PATH)
+            (qr_image or self.main_window.current_qr_image).save(filename)
             QMessageBox.information(self, "Success", "QR code saved successfully!")
             self.main_window.statusBar().showMessage("QR code saved successfully!")
 
     def on_scan_qr(self):
-        """Scan QR code from camera"""
+        """Scan QR code from camera (capture and decoding run off the GUI thread)"""
         try:
-            decoded_text = self.main_window.qr_handler.scan_from_camera()
+            dialog = CameraScanDialog(self.main_window.qr_handler, parent=self)
+            dialog.exec_()
+            decoded_text = dialog.decoded_text
 
             if decoded_text:
                 self.password_tab.set_password(decoded_text)
                 QMessageBox.information(self, "Success", "Password extracted from QR code!")
                 self.main_window.statusBar().showMessage("Password extracted from QR code!")
+            elif dialog.error:
+                QMessageBox.critical(self, "Error", f"Failed to scan QR code: {dialog.error}")
+                self.main_window.statusBar().showMessage("Failed to scan QR code")
             else:
                 QMessageBox.warning(self, "Result", "No QR code was detected.")
                 self.main_window.statusBar().showMessage("No QR code was detected.")
@@ -4,17 +4,16 @@ from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QGroupBox,
     QScrollArea, QFrame, QPushButton, QMessageBox, QDialog
 )
-from PyQt5.QtGui import QFont, QPixmap, QDesktopServices, QImage
+from PyQt5.QtGui import QFont, QPixmap, QDesktopServices
 from PyQt5.QtCore import Qt, QUrl, QIODevice, QBuffer, QByteArray
 
-from io import BytesIO
-import qrcode
-
 from app_config.app_config import APP_NAME, APP_VERSION, LOGO_PATH, MAYA_QR_KEY, MAYA_QR_PATH
 from utils.encryption import EncryptionManager
 from utils.file_handler import FileHandler
 from PIL import Image
-import resources_rc
+from utils.resource_loader import ResourceLoader
+
+ResourceLoader.ensure_loaded()
 
 class InfoPanel(QWidget):
     """Right info panel with QR, About, and Donations"""
@@ -173,22 +172,11 @@ class InfoPanel(QWidget):
             dialog.exec_()
             return
 
-        qr = qrcode.QRCode(
-            version=1,
-            error_correction=qrcode.constants.ERROR_CORRECT_H,
-            box_size=10,
-            border=2
-        )
-        qr.add_data(link)
-        qr.make(fit=True)
-        img = qr.make_image(fill_color="black", back_color="white")
-        buffer = BytesIO()
-        img.save(buffer, format="PNG")
-        image = QImage.fromData(buffer.getvalue())
-        pixmap = QPixmap.fromImage(image)
+        # Rendered straight at display size, no PNG round trip or rescale
+        pixmap = QPixmap.fromImage(self.main_window.qr_handler.generate_qimage(link, 250, border=2))
 
         label = QLabel()
-        label.setPixmap(pixmap.scaled(250, 250, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        label.setPixmap(pixmap)
         label.setAlignment(Qt.AlignCenter)
         layout.addWidget(label)
 
@@ -0,0 +1,78 @@
+# ui/wordlist_loading.py
+"""Background wordlist loading, so large wordlists do not delay first paint"""
+import time
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from core.wordlist_registry import WordlistRegistry
+
+
+class _LoadSignals(QObject):
+    """Signals emitted from the worker back to the GUI thread"""
+    finished = pyqtSignal(int, object, float)  # generation, words, elapsed ms
+    failed = pyqtSignal(int, str)
+
+
+class _LoadTask(QRunnable):
+    """Loads one wordlist through WordlistRegistry on a pool thread"""
+
+    def __init__(self, signals, generation, path):
+        super().__init__()
+        self.signals = signals
+        self.generation = generation
+        self.path = path
+
+    def run(self):
+        start = time.perf_counter()
+        try:
+            words = WordlistRegistry.get(self.path)
+        except Exception as e:
+            self.signals.failed.emit(self.generation, str(e))
+            return
+        self.signals.finished.emit(self.generation, words, (time.perf_counter() - start) * 1000)
+
+
+class AsyncWordlistLoader(QObject):
+    """Loads wordlists on a QThreadPool worker
+
+    Parsing a 1M-word text list takes seconds; compiled lists and lists
+    already in the registry return almost immediately. Only the result of
+    the latest load() is delivered.
+
+    Signals:
+        loaded(words, elapsed_ms): shared read-only words from the registry
+        failed(message)
+    """
+
+    loaded = pyqtSignal(object, float)
+    failed = pyqtSignal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.generation = 0
+        self.loading = False
+
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+
+        self._signals = _LoadSignals()
+        self._signals.finished.connect(self._on_finished)
+        self._signals.failed.connect(self._on_failed)
+
+    def load(self, path=None):
+        """Start loading path (None: the default wordlist); returns immediately"""
+        self.generation += 1
+        self.loading = True
+        self._pool.start(_LoadTask(self._signals, self.generation, path))
+
+    def _on_finished(self, generation, words, elapsed_ms):
+        if generation != self.generation:
+            return
+        self.loading = False
+        self.loaded.emit(words, elapsed_ms)
+
+    def _on_failed(self, generation, message):
+        if generation != self.generation:
+            return
+        self.loading = False
+        self.failed.emit(message)
@@ -0,0 +1,53 @@
+# utils/import_report.py
+"""Startup timeline of heavy module imports"""
+import sys
+import time
+
+
+class ImportReport:
+    """Records startup milestones and which heavy modules were loaded at each
+
+    Create it as early as possible in the entry point, then call mark() at
+    milestones such as "window shown". Each line of the summary shows the
+    elapsed time and whether OpenCV, pyzbar, etc. were already imported.
+    For a per-module breakdown run with: python -X importtime
+    """
+
+    HEAVY_MODULES = {
+        "PyQt5": "PyQt5.QtWidgets",
+        "OpenCV": "cv2",
+        "pyzbar": "pyzbar.pyzbar",
+        "qrcode": "qrcode",
+        "PIL": "PIL.Image",
+        "resources": "resources_rc",
+    }
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.marks = []
+
+    def mark(self, label):
+        """Record a milestone
+
+        Args:
+            label: Milestone name
+
+        Returns:
+            The formatted report line
+        """
+        elapsed_ms = (time.perf_counter() - self.start) * 1000
+        loaded = [name for name, module in self.HEAVY_MODULES.items() if module in sys.modules]
+        self.marks.append((label, elapsed_ms, loaded))
+        return self._format(label, elapsed_ms, loaded)
+
+    def is_loaded(self, name):
+        """Check whether a heavy module (by report name) is imported"""
+        return self.HEAVY_MODULES.get(name, name) in sys.modules
+
+    def summary(self):
+        """Return all milestones as a multi-line string"""
+        return "\n".join(self._format(*entry) for entry in self.marks)
+
+    @staticmethod
+    def _format(label, elapsed_ms, loaded):
+        return f"[startup] {elapsed_ms:8.1f} ms  {label}  (loaded: {', '.join(loaded) or 'none'})"
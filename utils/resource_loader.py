@@ -0,0 +1,55 @@
+# utils/resource_loader.py
+"""Qt resource registration (memory-mapped .rcc bundle with Python fallback)"""
+import os
+import sys
+
+from PyQt5.QtCore import QResource
+
+from app_config.app_config import RESOURCE_BUNDLE_NAME, safe_log
+
+
+class ResourceLoader:
+    """Registers the application's :/ resources exactly once
+
+    Prefers the binary bundle built by tools/build_resources.py, which Qt
+    memory-maps straight from disk. Falls back to importing the generated
+    resources_rc module when the bundle is missing or cannot be registered.
+    """
+
+    mode = None  # "rcc" or "module" once loaded
+    bundle_path = None
+
+    @classmethod
+    def ensure_loaded(cls):
+        """Register resources if not already done
+
+        Returns:
+            "rcc" or "module", depending on which source was registered
+        """
+        if cls.mode:
+            return cls.mode
+
+        for path in cls._bundle_candidates():
+            if os.path.exists(path) and QResource.registerResource(path):
+                cls.mode = "rcc"
+                cls.bundle_path = path
+                return cls.mode
+
+        import resources_rc  # noqa: F401 - registers itself on import
+
+        safe_log(f"ℹ️ {RESOURCE_BUNDLE_NAME} not found, using resources_rc module")
+        cls.mode = "module"
+        return cls.mode
+
+    @staticmethod
+    def _bundle_candidates():
+        """Locations checked for the bundle (PyInstaller, app dir, cwd)"""
+        app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        bases = [getattr(sys, "_MEIPASS", None), app_dir, os.getcwd()]
+        seen = []
+        for base in bases:
+            if base:
+                path = os.path.join(base, RESOURCE_BUNDLE_NAME)
+                if path not in seen:
+                    seen.append(path)
+        return seen